@@ -2,14 +2,51 @@
 OpenOA Wind Farm Analysis Dashboard - Complete Backend API
 Provides full access to all OpenOA analysis capabilities with real data
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response, Depends
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from typing import Optional, Dict, Any, List
+from contextlib import asynccontextmanager
+import asyncio
 import sys
 import os
+import tempfile
+import time
+import threading
+import multiprocessing
+import functools
+import inspect
+import hashlib
+import json
+from collections import OrderedDict
+from types import MappingProxyType
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
-import traceback
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+class _InProcessQueueHandler(QueueHandler):
+    """QueueHandler that enqueues records as-is; they never leave the process, so formatting
+    (including tracebacks) is left to the listener thread"""
+    def prepare(self, record):
+        return record
+
+# Request threads only enqueue log records; a background listener formats and writes them to stderr
+logger = logging.getLogger(__name__)
+_log_queue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_listener = QueueListener(_log_queue, _log_stream_handler)
+logger.addHandler(_InProcessQueueHandler(_log_queue))
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 # Add OpenOA to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
@@ -30,15 +67,85 @@ try:
     import numpy as np
     OPENOA_AVAILABLE = True
 except ImportError as e:
-    print(f"Warning: Could not import OpenOA: {e}")
+    logger.warning("Could not import OpenOA: %s", e)
     OPENOA_AVAILABLE = False
     pd = None
     np = None
 
+# Use the multi-threaded Arrow CSV reader, and Parquet caches of parsed files, when pyarrow is installed
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+    PARQUET_AVAILABLE = True
+except ImportError:
+    CSV_ENGINE = "c"
+    PARQUET_AVAILABLE = False
+
+# Serialize responses with orjson when installed (C encoder, NumPy-aware); stdlib json otherwise
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+
+    class FastJSONResponse(ORJSONResponse):
+        """orjson response that also accepts NumPy scalars and arrays"""
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    from fastapi.responses import JSONResponse as FastJSONResponse
+
+def usable_cpu_count():
+    """CPUs this process may run on (respects affinity masks / container CPU sets where the OS exposes them)"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+# CPU-bound analyses run in worker processes so they neither block the event loop nor contend for
+# the GIL. Workers are spawned rather than forked from the threaded server and load data on first use.
+# Each worker holds its own copy of the datasets, so the default is capped; ANALYSIS_WORKERS overrides it.
+ANALYSIS_WORKERS = int(os.environ.get("ANALYSIS_WORKERS", 0)) or min(usable_cpu_count(), 4)
+_analysis_executor = None
+_analysis_executor_lock = threading.Lock()
+
+def get_analysis_executor():
+    """Process pool for /api/run-analysis, created on first use"""
+    global _analysis_executor
+    with _analysis_executor_lock:
+        if _analysis_executor is None:
+            _analysis_executor = ProcessPoolExecutor(
+                max_workers=ANALYSIS_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _analysis_executor
+
+def shutdown_analysis_executor(executor=None):
+    """Stop the analysis worker processes, abandoning queued work
+
+    With ``executor`` given, only that pool is discarded (used to replace a broken pool
+    without racing a replacement another request already created).
+    """
+    global _analysis_executor
+    with _analysis_executor_lock:
+        if _analysis_executor is not None and executor in (None, _analysis_executor):
+            _analysis_executor.shutdown(wait=False, cancel_futures=True)
+            _analysis_executor = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the data cache before the first request is served, and the analysis workers in the background"""
+    worker_warmup = None
+    if OPENOA_AVAILABLE:
+        await warm_data_cache()
+        worker_warmup = asyncio.create_task(warm_analysis_workers())
+    yield
+    if worker_warmup is not None:
+        worker_warmup.cancel()
+    shutdown_analysis_executor()
+
 app = FastAPI(
     title="OpenOA Wind Farm Analytics API",
     description="Complete API for wind farm operational analysis using OpenOA",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 # CORS configuration - Allow Vercel frontend and localhost for development
@@ -58,80 +165,566 @@ app.add_middleware(
 )
 
 # Request/Response Models
+class AnalysisParameters(BaseModel):
+    """Optional analysis inputs, bounded (and closed to unknown keys) so an oversized or malformed
+    request is rejected with a 422 before it takes an analysis worker or a result-cache slot"""
+    model_config = ConfigDict(extra="forbid")
+
+    n_simulations: Optional[int] = Field(None, ge=1, le=100_000)
+
 class AnalysisRequest(BaseModel):
     analysis_type: str
     use_example_data: bool = True
-    parameters: Optional[Dict[str, Any]] = None
+    parameters: Optional[AnalysisParameters] = None
 
 class AnalysisResponse(BaseModel):
     status: str
     analysis_type: str
     results: Dict[str, Any]
-    timestamp: str
+    timestamp: str  # UTC, ISO-8601, one-second resolution
     message: str
-    execution_time_seconds: Optional[float] = None
+    execution_time_ms: Optional[int] = None
 
 # Data paths
 EXAMPLE_DATA_PATH = os.path.join(os.path.dirname(__file__), "../../examples/data")
 LA_HAUTE_BORNE_PATH = os.path.join(EXAMPLE_DATA_PATH, "la_haute_borne")
 PLANT_META_PATH = os.path.join(EXAMPLE_DATA_PATH, "plant_meta.yml")
 
-# Cache for loaded data
-_data_cache = {}
+# SCADA columns are read straight into narrow dtypes: float32 halves the memory traffic of
+# every aggregation and the categorical turbine name makes filters/groupbys integer compares
+SCADA_DTYPES = {
+    'Wind_turbine_name': 'category',
+    'Ba_avg': 'float32',
+    'P_avg': 'float32',
+    'Ws_avg': 'float32',
+    'Va_avg': 'float32',
+    'Ot_avg': 'float32',
+    'Ya_avg': 'float32',
+    'Wa_avg': 'float32'
+}
+
+MONTH_NAMES = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# Meteorological seasons and the season code of each calendar month (index 0 is unused/missing)
+SEASONS = ('Winter', 'Spring', 'Summer', 'Fall')
+MONTH_SEASON_CODES = (-1, 0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 0)
+
+# Default power curve bin width (m/s); bins for this width are precomputed at load time
+POWER_CURVE_BIN_WIDTH = 0.5
+
+# Browser cache lifetime for responses built only from the static example data
+RESPONSE_MAX_AGE_SECONDS = 300
+
+# Cache for loaded data: bounded LRU, with one lock per key so concurrent cold requests load once
+DATA_CACHE_MAXSIZE = 32
+_data_cache = OrderedDict()
+_data_cache_lock = threading.Lock()
+_data_cache_key_locks = {}
 
 def get_cached_data(key: str, loader_func):
     """Cache data to avoid reloading"""
-    if key not in _data_cache:
-        _data_cache[key] = loader_func()
-    return _data_cache[key]
+    with _data_cache_lock:
+        if key in _data_cache:
+            _data_cache.move_to_end(key)
+            return _data_cache[key]
+        key_lock = _data_cache_key_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        # Another thread may have finished loading while we waited for the key lock
+        with _data_cache_lock:
+            if key in _data_cache:
+                return _data_cache[key]
+        data = loader_func()
+        with _data_cache_lock:
+            _data_cache[key] = data
+            while len(_data_cache) > DATA_CACHE_MAXSIZE:
+                _data_cache.popitem(last=False)
+        return data
+
+def read_csv(path: str, **kwargs):
+    """Read a CSV file with the fastest available pandas parser engine"""
+    return pd.read_csv(path, engine=CSV_ENGINE, **kwargs)
+
+def parse_datetime(col, utc: bool = False):
+    """Return a timestamp column as naive datetime64[ns]
+
+    The Arrow engine already parses ISO timestamps while reading, so the string parse
+    only runs for the C engine fallback (or unparseable columns).
+    """
+    if not pd.api.types.is_datetime64_any_dtype(col):
+        col = pd.to_datetime(col, utc=utc, errors='coerce')
+    if col.dt.tz is not None:
+        # Aware values are stored as UTC instants, so the naive UTC column is a view of them
+        col = pd.Series(col.values, index=col.index, name=col.name)
+    if col.dtype != 'datetime64[ns]':
+        col = col.astype('datetime64[ns]')
+    return col
+
+def datetime_field(col, field: str):
+    """int32 calendar field (e.g. 'year', 'month') of a datetime column; -1 where the timestamp is missing"""
+    values = getattr(col.dt, field).to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.nan_to_num(values, nan=-1).astype(np.int32)
+
+def year_month_key(col):
+    """int32 calendar-month key (year * 12 + month - 1) of a datetime column; -1 where the timestamp is missing"""
+    year, month = datetime_field(col, 'year'), datetime_field(col, 'month')
+    return np.where(year >= 0, year * 12 + month - 1, -1).astype(np.int32)
+
+def year_month_labels(keys):
+    """'YYYY-MM' labels for year_month_key values"""
+    return [f"{key // 12:04d}-{key % 12 + 1:02d}" for key in keys]
+
+def grouped_sums(keys, *columns):
+    """Per-key sums and non-NaN counts of each column for small non-negative int keys (-1 = skip row)
+
+    A dense np.bincount accumulation in place of a hashing groupby. Returns the occupied keys in
+    ascending order, plus (n_columns, n_keys) arrays of sums and counts; sums / counts gives the
+    NaN-skipping means of groupby().mean().
+    """
+    keys = np.asarray(keys)
+    valid = keys >= 0
+    idx = keys[valid]
+    base = int(idx.min()) if len(idx) else 0
+    idx = idx - base
+    n = int(idx.max()) + 1 if len(idx) else 0
+    occupied = np.bincount(idx, minlength=n) > 0
+    sums = np.empty((len(columns), int(occupied.sum())))
+    counts = np.empty_like(sums)
+    for i, col in enumerate(columns):
+        values = np.asarray(col, dtype=np.float64)[valid]
+        has_value = ~np.isnan(values)
+        sums[i] = np.bincount(idx[has_value], weights=values[has_value], minlength=n)[occupied]
+        counts[i] = np.bincount(idx[has_value], minlength=n)[occupied]
+    return np.flatnonzero(occupied) + base, sums, counts
+
+_utc_timestamp_cache = (None, "")
+
+def utc_timestamp():
+    """Current UTC time as ISO-8601 at one-second resolution, formatted at most once per second"""
+    global _utc_timestamp_cache
+    second = int(time.time())
+    cached_second, text = _utc_timestamp_cache
+    if second != cached_second:
+        text = datetime.fromtimestamp(second, timezone.utc).isoformat()
+        _utc_timestamp_cache = (second, text)
+    return text
+
+def rounded(values, decimals: int):
+    """Round a column or array in one vectorized pass, as float64 so JSON gets short decimals"""
+    return np.round(np.asarray(values, dtype=np.float64), decimals)
+
+def json_records(df):
+    """Convert a small result frame to a list of dicts, with NaN/NaT as None"""
+    return df.astype(object).where(df.notna(), None).to_dict('records')
+
+def with_parquet_cache(csv_path: str, parse_func, dtypes: Optional[Dict[str, str]] = None):
+    """Return the frame parsed from ``csv_path``, persisted as a Parquet sidecar next to it
+
+    Cold starts then read the typed, columnar sidecar instead of re-tokenizing the CSV and
+    re-parsing timestamps. The sidecar is rebuilt whenever the CSV is newer, or when its columns
+    no longer have the ``dtypes`` that parse_func reads them as; without pyarrow or on a
+    read-only filesystem this falls back to parsing the CSV every time.
+    """
+    if not PARQUET_AVAILABLE:
+        return parse_func()
+
+    parquet_path = csv_path + ".parquet"
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+        try:
+            df = pd.read_parquet(parquet_path)
+            if dtypes is None or all(str(df[col].dtype) == dtype for col, dtype in dtypes.items()):
+                return df
+            logger.info("Rebuilding Parquet cache %s for changed column types", parquet_path)
+        except Exception as e:
+            logger.warning("Ignoring unreadable Parquet cache %s: %s", parquet_path, e)
+
+    df = parse_func()
+    tmp_path = None
+    try:
+        # Write to a temporary file first so concurrent readers never see a partial sidecar
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(parquet_path))
+        os.close(fd)
+        df.to_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, parquet_path)
+    except Exception as e:
+        logger.warning("Could not write Parquet cache %s: %s", parquet_path, e)
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return df
 
 def load_scada_data():
     """Load and preprocess SCADA data"""
     scada_file = os.path.join(LA_HAUTE_BORNE_PATH, "la-haute-borne-data-2014-2015.csv")
     if not os.path.exists(scada_file):
         raise FileNotFoundError(f"SCADA file not found: {scada_file}")
-    df = pd.read_csv(scada_file)
-    # Handle datetime parsing safely
-    df['Date_time'] = pd.to_datetime(df['Date_time'], utc=True, errors='coerce')
-    if df['Date_time'].dt.tz is not None:
-        df['Date_time'] = df['Date_time'].dt.tz_localize(None)
-    return df
+
+    def parse():
+        df = read_csv(scada_file, dtype=SCADA_DTYPES)
+        # Handle datetime parsing safely
+        df['Date_time'] = parse_datetime(df['Date_time'], utc=True)
+        # Keep rows in time order so date ranges can be sliced with searchsorted
+        if not df['Date_time'].is_monotonic_increasing:
+            df = df.sort_values('Date_time', kind='stable', ignore_index=True)
+        return df
+
+    return with_parquet_cache(scada_file, parse, SCADA_DTYPES)
 
 def load_plant_data():
     """Load plant-level meter data"""
     plant_file = os.path.join(LA_HAUTE_BORNE_PATH, "plant_data.csv")
     if not os.path.exists(plant_file):
         raise FileNotFoundError(f"Plant file not found: {plant_file}")
-    df = pd.read_csv(plant_file)
-    df['time_utc'] = pd.to_datetime(df['time_utc'], utc=True, errors='coerce')
-    if df['time_utc'].dt.tz is not None:
-        df['time_utc'] = df['time_utc'].dt.tz_localize(None)
-    return df
+
+    def parse():
+        df = read_csv(plant_file)
+        df['time_utc'] = parse_datetime(df['time_utc'], utc=True)
+        return df
+
+    return with_parquet_cache(plant_file, parse)
 
 def load_asset_data():
     """Load turbine asset information"""
     asset_file = os.path.join(LA_HAUTE_BORNE_PATH, "la-haute-borne_asset_table.csv")
     if not os.path.exists(asset_file):
         raise FileNotFoundError(f"Asset file not found: {asset_file}")
-    return pd.read_csv(asset_file)
+    return read_csv(asset_file)
 
 def load_era5_data():
     """Load ERA5 reanalysis data"""
     era5_file = os.path.join(LA_HAUTE_BORNE_PATH, "era5_wind_la_haute_borne.csv")
     if not os.path.exists(era5_file):
         raise FileNotFoundError(f"ERA5 file not found: {era5_file}")
-    df = pd.read_csv(era5_file)
-    df['datetime'] = pd.to_datetime(df['datetime'], errors='coerce')
-    return df
+
+    def parse():
+        df = read_csv(era5_file, index_col=0)
+        df['datetime'] = parse_datetime(df['datetime'])
+        # Keep rows in time order so periods can be sliced with searchsorted
+        if not df['datetime'].is_monotonic_increasing:
+            df = df.sort_values('datetime', kind='stable')
+        return df
+
+    return with_parquet_cache(era5_file, parse)
 
 def load_merra2_data():
     """Load MERRA2 reanalysis data"""
     merra2_file = os.path.join(LA_HAUTE_BORNE_PATH, "merra2_la_haute_borne.csv")
     if not os.path.exists(merra2_file):
         raise FileNotFoundError(f"MERRA2 file not found: {merra2_file}")
-    df = pd.read_csv(merra2_file)
-    df['datetime'] = pd.to_datetime(df['datetime'], errors='coerce')
-    return df
+
+    def parse():
+        df = read_csv(merra2_file, index_col=0)
+        df['datetime'] = parse_datetime(df['datetime'])
+        return df
+
+    return with_parquet_cache(merra2_file, parse)
+
+def load_scada_enriched():
+    """SCADA data plus the derived calendar and wind speed bin columns used by the explorer endpoints"""
+    df = cached_scada()
+    months = df['Date_time'].dt.month.fillna(0).to_numpy(dtype=np.intp)
+    season_codes = np.take(np.array(MONTH_SEASON_CODES, dtype=np.int8), months)
+    season = pd.Categorical.from_codes(season_codes, categories=SEASONS)
+    ws_bin_idx = power_curve_bin_index(df['Ws_avg'].to_numpy(), power_curve_bins(POWER_CURVE_BIN_WIDTH))
+    return df.assign(
+        month_key=year_month_key(df['Date_time']),
+        season=season,
+        ws_bin_idx=ws_bin_idx.astype(np.int16)
+    )
+
+# Independent source datasets, and the frames derived from the cached SCADA data
+DATA_LOADERS = (
+    ("scada", load_scada_data),
+    ("plant", load_plant_data),
+    ("asset", load_asset_data),
+    ("era5", load_era5_data),
+    ("merra2", load_merra2_data),
+)
+
+async def warm_data_cache():
+    """Load every dataset concurrently in the default thread pool
+
+    Failures are reported but not raised, so the API still starts (and /api/debug/files can
+    diagnose missing files); the affected endpoints retry the load on request.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def load_all(loaders):
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, get_cached_data, key, loader) for key, loader in loaders),
+            return_exceptions=True
+        )
+        for (key, _), result in zip(loaders, results):
+            if isinstance(result, Exception):
+                logger.warning("Could not preload %s data: %s", key, result)
+
+    await load_all(DATA_LOADERS)
+    await load_all(DERIVED_DATA_LOADERS)
+    await load_all(RESPONSE_LOADERS)
+
+def _warm_analysis_worker():
+    """Runs inside an analysis worker: unpickling this function imports the app (and OpenOA) there,
+    the datasets are loaded into that worker's cache, and each analysis is run once with its
+    default parameters so its first-call costs are paid before a user request arrives"""
+    for key, loader in DATA_LOADERS + DERIVED_DATA_LOADERS:
+        get_cached_data(key, loader)
+    for analysis in dict.fromkeys(ANALYSIS_DISPATCH.values()):
+        try:
+            analysis({})
+        except Exception as e:
+            logger.warning("Could not warm %s: %s", analysis.__name__, e)
+    return os.getpid()
+
+async def warm_analysis_workers():
+    """Start the analysis worker processes and load OpenOA and the data in them ahead of the first
+    /api/run-analysis request (best effort: a fast worker may pick up more than one warmup task),
+    then fill the result cache with every analysis at its default parameters"""
+    loop = asyncio.get_running_loop()
+    executor = get_analysis_executor()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(executor, _warm_analysis_worker) for _ in range(ANALYSIS_WORKERS)),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning("Could not warm an analysis worker: %s", result)
+
+    # The analyses are independent, so they run concurrently across the pool; requests arriving
+    # meanwhile join these runs instead of starting their own
+    analysis_types = {func: analysis_type for analysis_type, func in ANALYSIS_DISPATCH.items()}.values()
+    results = await asyncio.gather(
+        *(shared_analysis_run(analysis_cache_key(analysis_type, {}), analysis_type, {})
+          for analysis_type in analysis_types),
+        return_exceptions=True
+    )
+    for analysis_type, result in zip(analysis_types, results):
+        if isinstance(result, Exception):
+            logger.warning("Could not precompute the %s analysis: %s", analysis_type, result)
+
+def load_scada_turbine_index():
+    """Map each turbine name to the row positions of its records in the cached SCADA frame"""
+    df = cached_scada()
+    return df.groupby('Wind_turbine_name', sort=False, observed=True).indices
+
+def select_turbine(scada_df, turbine_id: str):
+    """Rows of a SCADA frame (base or enriched) belonging to one turbine"""
+    rows = cached_scada_by_turbine().get(turbine_id)
+    if rows is None:
+        return scada_df.iloc[0:0]
+    return scada_df.take(rows)
+
+def select_time_range(df, column: str, start_date: Optional[Any] = None, end_date: Optional[Any] = None):
+    """Rows with start_date <= column <= end_date, sliced by binary search (column must be sorted);
+    the bounds are date strings or timestamps"""
+    ts = df[column].to_numpy()
+    lo = np.searchsorted(ts, pd.to_datetime(start_date).to_datetime64(), side='left') if start_date else 0
+    hi = np.searchsorted(ts, pd.to_datetime(end_date).to_datetime64(), side='right') if end_date else len(ts)
+    return df.iloc[lo:hi]
+
+def power_curve_bins(bin_width: float):
+    """Wind speed bin edges (m/s) for the measured power curve"""
+    return np.arange(0, 30 + bin_width, bin_width)
+
+def power_curve_bin_index(ws, bins):
+    """Bin index i such that bins[i] < ws <= bins[i + 1] (pd.cut's right-closed intervals); -1 or len(bins) - 1 when outside"""
+    return np.digitize(ws, bins, right=True) - 1
+
+def uniform_bin_index(values, lo: float, width: float):
+    """Bin index i such that lo + i * width < value <= lo + (i + 1) * width (pd.cut's right-closed
+    intervals), by arithmetic instead of a search over the edges; values must be finite, and a
+    value equal to ``lo`` maps to -1"""
+    return np.ceil((values - lo) / width).astype(np.intp) - 1
+
+def binned_power_stats(bin_idx, ws, power, n_bins: int):
+    """Per wind speed bin count, mean/std power, 5th/95th power percentiles and mean wind speed
+
+    Replaces a groupby with per-group ``np.percentile`` lambdas: the moments come from
+    ``np.bincount`` and the percentiles from a single sort of the power values within their
+    bins, interpolated the same way as ``np.percentile``. Only non-empty bins are returned.
+    """
+    valid = (bin_idx >= 0) & (bin_idx < n_bins)
+    bin_idx = bin_idx[valid]
+    ws = ws[valid].astype(np.float64)
+    power = power[valid].astype(np.float64)
+
+    count = np.bincount(bin_idx, minlength=n_bins)
+    occupied = count > 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ws_mean = np.bincount(bin_idx, weights=ws, minlength=n_bins) / count
+        power_mean = np.bincount(bin_idx, weights=power, minlength=n_bins) / count
+        sq_dev = np.bincount(bin_idx, weights=(power - power_mean[bin_idx]) ** 2, minlength=n_bins)
+        power_std = np.sqrt(sq_dev / (count - 1))
+
+    # Sort by (bin, power) so each bin's values are a contiguous sorted run: order by power,
+    # then a stable (radix) sort on the small integer bin index
+    order = np.argsort(power)
+    order = order[np.argsort(bin_idx[order], kind='stable')]
+    sorted_power = power[order]
+    starts = (np.cumsum(count) - count)[occupied]
+    last = (count - 1)[occupied]
+
+    def percentile(q):
+        pos = q / 100 * last
+        lo = np.floor(pos).astype(np.int64)
+        t = pos - lo
+        a = sorted_power[starts + lo]
+        b = sorted_power[starts + np.minimum(lo + 1, last)]
+        return np.where(t >= 0.5, b - (b - a) * (1 - t), a + (b - a) * t)
+
+    return pd.DataFrame({
+        'ws_bin': np.flatnonzero(occupied),
+        'power_mean': power_mean[occupied],
+        'power_std': power_std[occupied],
+        'count': count[occupied],
+        'power_p5': percentile(5),
+        'power_p95': percentile(95),
+        'ws_mean': ws_mean[occupied]
+    })
+
+def load_asset_records():
+    """Asset table as a list of row dicts, built once and shared by every response that embeds it"""
+    return cached_asset().to_dict('records')
+
+def load_scada_stats():
+    """SCADA reductions shared by the analyses, computed once per cached SCADA frame
+
+    Besides the plant-wide figures, holds grouped_sums results (keys, sums, counts) of P_avg per
+    turbine code, per year_month_key month, and (with Ws_avg) per calendar month (1-12).
+    """
+    df = cached_scada()
+    start, end = df['Date_time'].min(), df['Date_time'].max()
+    power_sum_kw = float(df['P_avg'].sum())
+    month_key = cached_scada_enriched()['month_key'].to_numpy()
+    return MappingProxyType({
+        "records": len(df),
+        "power_sum_kw": power_sum_kw,
+        "power_mean_kw": float(df['P_avg'].mean()),
+        # P_avg is kW over 10-minute records
+        "turbine_energy_kwh": power_sum_kw * (10/60),
+        "start": start,
+        "end": end,
+        "years": (end - start).days / 365.25,
+        "turbine_power": grouped_sums(df['Wind_turbine_name'].cat.codes, df['P_avg']),
+        "month_power": grouped_sums(month_key, df['P_avg']),
+        "calendar_month_power_ws": grouped_sums(
+            np.where(month_key >= 0, month_key % 12 + 1, -1), df['P_avg'], df['Ws_avg']
+        )
+    })
+
+def load_plant_stats():
+    """Plant meter totals shared by the analyses, plus the grouped_sums result (keys, sums, counts)
+    of net energy per year_month_key month"""
+    df = cached_plant()
+    return MappingProxyType({
+        "records": len(df),
+        "net_energy_kwh": float(df['net_energy_kwh'].sum()),
+        "month_net_energy": grouped_sums(year_month_key(df['time_utc']), df['net_energy_kwh']),
+        "availability_kwh": float(df['availability_kwh'].sum()),
+        "curtailment_kwh": float(df['curtailment_kwh'].sum())
+    })
+
+def load_era5_stats():
+    """Long-term and SCADA-period mean ERA5 wind speeds, the long-term correction factor they give,
+    and the calendar years ERA5 covers"""
+    era5_df = cached_era5()
+    scada_stats = cached_scada_stats()
+    op_period = select_time_range(era5_df, 'datetime', scada_stats['start'], scada_stats['end'])
+    ltm_ws = float(era5_df['ws_100m'].mean())
+    op_period_ws = float(op_period['ws_100m'].mean()) if len(op_period) > 0 else ltm_ws
+    return MappingProxyType({
+        "ltm_ws": ltm_ws,
+        "op_period_ws": op_period_ws,
+        # Wind-energy relationship approximation (cubic relationship adjusted)
+        "ltm_correction": (ltm_ws / op_period_ws) ** 2.5 if op_period_ws > 0 else 1.0,
+        "first_year": int(era5_df['datetime'].min().year),
+        "last_year": int(era5_df['datetime'].max().year)
+    })
+
+DERIVED_DATA_LOADERS = (
+    ("scada_enriched", load_scada_enriched),
+    ("scada_by_turbine", load_scada_turbine_index),
+    ("asset_records", load_asset_records),
+    ("scada_stats", load_scada_stats),
+    ("plant_stats", load_plant_stats),
+    ("era5_stats", load_era5_stats),
+)
+
+def data_accessor(key: str, loader_func):
+    """Zero-argument accessor for one data cache entry, so call sites name the dataset instead of
+    repeating (and possibly mismatching) its key/loader pair"""
+    return functools.partial(get_cached_data, key, loader_func)
+
+cached_scada = data_accessor("scada", load_scada_data)
+cached_plant = data_accessor("plant", load_plant_data)
+cached_asset = data_accessor("asset", load_asset_data)
+cached_era5 = data_accessor("era5", load_era5_data)
+cached_merra2 = data_accessor("merra2", load_merra2_data)
+cached_scada_enriched = data_accessor("scada_enriched", load_scada_enriched)
+cached_scada_by_turbine = data_accessor("scada_by_turbine", load_scada_turbine_index)
+cached_asset_records = data_accessor("asset_records", load_asset_records)
+cached_scada_stats = data_accessor("scada_stats", load_scada_stats)
+cached_plant_stats = data_accessor("plant_stats", load_plant_stats)
+cached_era5_stats = data_accessor("era5_stats", load_era5_stats)
+
+def openoa_endpoint(error_prefix: str):
+    """Shared guard for endpoints backed by OpenOA data
+
+    Passes HTTPExceptions through and turns any other failure into a 500 whose detail starts with
+    ``error_prefix``. Works for sync and async endpoints. OPENOA_AVAILABLE is fixed at import, so
+    the check happens here rather than per request: without OpenOA the endpoint is replaced by a
+    parameterless stub that answers 503 before any query or body parsing.
+    """
+    def server_error(func, e: Exception):
+        logger.exception("%s in %s", error_prefix, func.__name__)
+        return HTTPException(status_code=500, detail=f"{error_prefix}: {str(e)}")
+
+    def decorate(func):
+        if not OPENOA_AVAILABLE:
+            @functools.wraps(func)
+            async def unavailable():
+                raise HTTPException(status_code=503, detail="OpenOA not available")
+            unavailable.__signature__ = inspect.Signature()
+            return unavailable
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except HTTPException:
+                    raise
+                except Exception as e:
+                    raise server_error(func, e) from e
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                try:
+                    return func(*args, **kwargs)
+                except HTTPException:
+                    raise
+                except Exception as e:
+                    raise server_error(func, e) from e
+        return wrapper
+    return decorate
+
+def serialized_response(payload_func):
+    """get_cached_data loader for a constant endpoint: its JSON body bytes and ETag"""
+    def load():
+        body = FastJSONResponse(jsonable_encoder(payload_func())).body
+        return body, f'"{hashlib.md5(body).hexdigest()}"'
+    return load
+
+def etag_json_response(request: Request, body: bytes, etag: str):
+    """Pre-serialized JSON body with its ETag; 304 when the client already holds it"""
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={RESPONSE_MAX_AGE_SECONDS}"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def cached_json_response(request: Request, key: str, payload_func):
+    """Serve a body that depends only on the static datasets: serialized once, revalidated by ETag"""
+    body, etag = get_cached_data(key, serialized_response(payload_func))
+    return etag_json_response(request, body, etag)
 
 # =============================================================================
 # HEALTH & INFO ENDPOINTS
@@ -151,7 +744,7 @@ async def health_check():
         "status": "healthy",
         "openoa_available": OPENOA_AVAILABLE,
         "openoa_version": openoa.__version__ if OPENOA_AVAILABLE else None,
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": utc_timestamp()
     }
 
 @app.get("/api/debug/files")
@@ -172,17 +765,11 @@ async def debug_files():
         "app_dir": os.path.dirname(__file__)
     }
 
-@app.get("/api/info")
-async def get_api_info():
-    """Get comprehensive information about the wind farm and available analyses"""
-    if not OPENOA_AVAILABLE:
-        raise HTTPException(status_code=503, detail="OpenOA not available")
-    
-    try:
-        asset_df = get_cached_data("asset", load_asset_data)
-        scada_df = get_cached_data("scada", load_scada_data)
+def api_info_payload():
+    """Response body of /api/info, built from the static example data"""
+    scada_df = cached_scada()
     
-        return {
+    return {
             "analyses": [
                 {
                     "id": "monte_carlo_aep",
@@ -239,7 +826,7 @@ async def get_api_info():
             "hub_height_m": 80,
             "rotor_diameter_m": 82,
             "commissioning_year": 2009,
-            "turbines": asset_df.to_dict('records')
+            "turbines": cached_asset_records()
         },
         "data": {
             "scada_period": {
@@ -251,135 +838,137 @@ async def get_api_info():
             "data_resolution_minutes": 10
         }
     }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error loading data: {str(e)}")
+
+@app.get("/api/info")
+@openoa_endpoint("Error loading data")
+def get_api_info(request: Request):
+    """Get comprehensive information about the wind farm and available analyses"""
+    return cached_json_response(request, "response:info", api_info_payload)
 
 # =============================================================================
 # DATA EXPLORER ENDPOINTS
 # =============================================================================
 
-@app.get("/api/data/overview")
-async def get_data_overview():
-    """Get comprehensive overview of all available data"""
-    if not OPENOA_AVAILABLE:
-        raise HTTPException(status_code=503, detail="OpenOA not available")
+# Endpoints that aggregate the cached DataFrames are plain ``def`` functions so FastAPI runs
+# them in its threadpool instead of blocking the event loop (and /health) while pandas works.
+
+def data_overview_payload():
+    """Response body of /api/data/overview, built from the static example data"""
+    scada_df = cached_scada()
+    plant_df = cached_plant()
+    asset_df = cached_asset()
+    era5_df = cached_era5()
+    merra2_df = cached_merra2()
+
+    # Calculate total production period in years
+    date_range = (scada_df['Date_time'].max() - scada_df['Date_time'].min()).days / 365.25
     
-    try:
-        scada_df = get_cached_data("scada", load_scada_data)
-        plant_df = get_cached_data("plant", load_plant_data)
-        asset_df = get_cached_data("asset", load_asset_data)
-        era5_df = get_cached_data("era5", load_era5_data)
-        merra2_df = get_cached_data("merra2", load_merra2_data)
-    
-        # Calculate total production period in years
-        date_range = (scada_df['Date_time'].max() - scada_df['Date_time'].min()).days / 365.25
-        
-        return {
-            "scada": {
-                "rows": int(len(scada_df)),
-                "columns": list(scada_df.columns),
-                "turbines": scada_df['Wind_turbine_name'].unique().tolist(),
-                "date_range": {
-                    "start": str(scada_df['Date_time'].min()),
-                    "end": str(scada_df['Date_time'].max()),
-                    "years": round(date_range, 2)
-                },
-                "total_energy_gwh": round(float(scada_df['P_avg'].sum() / 1e6), 2),
-                "avg_wind_speed_ms": round(float(scada_df['Ws_avg'].mean()), 2)
-            },
-            "plant_meter": {
-                "rows": int(len(plant_df)),
-                "columns": list(plant_df.columns),
-                "total_energy_gwh": round(float(plant_df['net_energy_kwh'].sum() / 1e6), 2),
-                "availability_loss_gwh": round(float(plant_df['availability_kwh'].sum() / 1e6), 3) if 'availability_kwh' in plant_df.columns else 0,
-                "curtailment_gwh": round(float(plant_df['curtailment_kwh'].sum() / 1e6), 4) if 'curtailment_kwh' in plant_df.columns else 0
+    return {
+        "scada": {
+            "rows": int(len(scada_df)),
+            "columns": list(scada_df.columns),
+            "turbines": scada_df['Wind_turbine_name'].unique().tolist(),
+            "date_range": {
+                "start": str(scada_df['Date_time'].min()),
+                "end": str(scada_df['Date_time'].max()),
+                "years": round(date_range, 2)
             },
-            "assets": {
-                "count": int(len(asset_df)),
-                "total_capacity_kw": int(asset_df['rated_power'].sum()) if 'rated_power' in asset_df.columns else 8200,
-                "turbines": asset_df.to_dict('records')
+            "total_energy_gwh": round(float(scada_df['P_avg'].sum() / 1e6), 2),
+            "avg_wind_speed_ms": round(float(scada_df['Ws_avg'].mean()), 2)
+        },
+        "plant_meter": {
+            "rows": int(len(plant_df)),
+            "columns": list(plant_df.columns),
+            "total_energy_gwh": round(float(plant_df['net_energy_kwh'].sum() / 1e6), 2),
+            "availability_loss_gwh": round(float(plant_df['availability_kwh'].sum() / 1e6), 3) if 'availability_kwh' in plant_df.columns else 0,
+            "curtailment_gwh": round(float(plant_df['curtailment_kwh'].sum() / 1e6), 4) if 'curtailment_kwh' in plant_df.columns else 0
+        },
+        "assets": {
+            "count": int(len(asset_df)),
+            "total_capacity_kw": int(asset_df['rated_power'].sum()) if 'rated_power' in asset_df.columns else 8200,
+            "turbines": cached_asset_records()
+        },
+        "reanalysis": {
+            "era5": {
+                "rows": int(len(era5_df)),
+                "period": f"{era5_df['datetime'].min().year}-{era5_df['datetime'].max().year}",
+                "avg_wind_speed_ms": round(float(era5_df['ws_100m'].mean()), 2)
             },
-            "reanalysis": {
-                "era5": {
-                    "rows": int(len(era5_df)),
-                    "period": f"{era5_df['datetime'].min().year}-{era5_df['datetime'].max().year}",
-                    "avg_wind_speed_ms": round(float(era5_df['ws_100m'].mean()), 2)
-                },
-                "merra2": {
-                    "rows": int(len(merra2_df)),
-                    "period": f"{merra2_df['datetime'].min().year}-{merra2_df['datetime'].max().year}",
-                    "avg_wind_speed_ms": round(float(merra2_df['ws_50m'].mean()), 2)
-                }
+            "merra2": {
+                "rows": int(len(merra2_df)),
+                "period": f"{merra2_df['datetime'].min().year}-{merra2_df['datetime'].max().year}",
+                "avg_wind_speed_ms": round(float(merra2_df['ws_50m'].mean()), 2)
             }
         }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error in data overview: {str(e)}")
+    }
+
+@app.get("/api/data/overview")
+@openoa_endpoint("Error in data overview")
+def get_data_overview(request: Request):
+    """Get comprehensive overview of all available data"""
+    return cached_json_response(request, "response:overview", data_overview_payload)
 
 @app.get("/api/data/scada/summary")
-async def get_scada_summary():
+@openoa_endpoint("Error in SCADA summary")
+def get_scada_summary():
     """Get detailed SCADA data summary statistics"""
-    if not OPENOA_AVAILABLE:
-        raise HTTPException(status_code=503, detail="OpenOA not available")
-    
-    scada_df = get_cached_data("scada", load_scada_data)
+    scada_df = cached_scada()
     date_range_years = (scada_df['Date_time'].max() - scada_df['Date_time'].min()).days / 365.25
     
-    # Per-turbine statistics
-    turbine_stats = []
-    for turbine in sorted(scada_df['Wind_turbine_name'].unique()):
-        t_df = scada_df[scada_df['Wind_turbine_name'] == turbine]
-        turbine_stats.append({
-            "turbine_id": turbine,
-            "total_energy_mwh": round(float(t_df['P_avg'].sum() / 1000), 1),
-            "annual_energy_mwh": round(float(t_df['P_avg'].sum() / 1000 / date_range_years), 1),
-            "avg_power_kw": round(float(t_df['P_avg'].mean()), 1),
-            "max_power_kw": round(float(t_df['P_avg'].max()), 1),
-            "avg_wind_speed_ms": round(float(t_df['Ws_avg'].mean()), 2),
-            "max_wind_speed_ms": round(float(t_df['Ws_avg'].max()), 2),
-            "avg_temperature_c": round(float(t_df['Ot_avg'].mean()), 1),
-            "capacity_factor_percent": round(float(t_df['P_avg'].mean() / 2050 * 100), 1),
-            "data_points": int(len(t_df)),
-            "data_availability_percent": round(float(len(t_df) / (365.25 * 24 * 6 * date_range_years) * 100), 1)
-        })
-    
-    # Monthly aggregation
-    scada_df_copy = scada_df.copy()
-    scada_df_copy['month'] = scada_df_copy['Date_time'].dt.to_period('M')
-    monthly = scada_df_copy.groupby('month').agg({
-        'P_avg': 'sum',
-        'Ws_avg': 'mean',
-        'Ot_avg': 'mean'
-    }).reset_index()
-    monthly['month'] = monthly['month'].astype(str)
-    
-    monthly_data = [
+    # Per-turbine statistics (single grouped pass over the SCADA columns)
+    per_turbine = scada_df.groupby('Wind_turbine_name', observed=True).agg(
+        total_p=('P_avg', 'sum'),
+        mean_p=('P_avg', 'mean'),
+        max_p=('P_avg', 'max'),
+        mean_ws=('Ws_avg', 'mean'),
+        max_ws=('Ws_avg', 'max'),
+        mean_ot=('Ot_avg', 'mean'),
+        n=('P_avg', 'size')
+    ).sort_index()
+
+    turbine_stats = [
         {
-            "month": row['month'],
-            "energy_mwh": round(float(row['P_avg'] / 1000), 1),
-            "avg_wind_speed_ms": round(float(row['Ws_avg']), 2),
-            "avg_temperature_c": round(float(row['Ot_avg']), 1)
+            "turbine_id": row.Index,
+            "total_energy_mwh": round(float(row.total_p / 1000), 1),
+            "annual_energy_mwh": round(float(row.total_p / 1000 / date_range_years), 1),
+            "avg_power_kw": round(float(row.mean_p), 1),
+            "max_power_kw": round(float(row.max_p), 1),
+            "avg_wind_speed_ms": round(float(row.mean_ws), 2),
+            "max_wind_speed_ms": round(float(row.max_ws), 2),
+            "avg_temperature_c": round(float(row.mean_ot), 1),
+            "capacity_factor_percent": round(float(row.mean_p / 2050 * 100), 1),
+            "data_points": int(row.n),
+            "data_availability_percent": round(float(row.n / (365.25 * 24 * 6 * date_range_years) * 100), 1)
         }
-        for _, row in monthly.iterrows()
+        for row in per_turbine.itertuples()
     ]
     
-    # Seasonal breakdown
-    scada_df_copy['season'] = scada_df_copy['Date_time'].dt.month.map(
-        lambda m: 'Winter' if m in [12, 1, 2] else 'Spring' if m in [3, 4, 5] else 'Summer' if m in [6, 7, 8] else 'Fall'
+    # Monthly aggregation
+    enriched_df = cached_scada_enriched()
+    month_keys, sums, counts = grouped_sums(
+        enriched_df['month_key'], enriched_df['P_avg'], enriched_df['Ws_avg'], enriched_df['Ot_avg']
     )
-    seasonal = scada_df_copy.groupby('season').agg({
-        'P_avg': 'mean',
-        'Ws_avg': 'mean'
-    }).reset_index()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts
+    monthly_data = pd.DataFrame({
+        "month": year_month_labels(month_keys),
+        "energy_mwh": rounded(sums[0] / 1000, 1),
+        "avg_wind_speed_ms": rounded(means[1], 2),
+        "avg_temperature_c": rounded(means[2], 1)
+    }).to_dict('records')
     
-    seasonal_data = [
-        {
-            "season": row['season'],
-            "avg_power_kw": round(float(row['P_avg']), 1),
-            "avg_wind_speed_ms": round(float(row['Ws_avg']), 2),
-            "capacity_factor_percent": round(float(row['P_avg'] / 2050 * 100), 1)
-        }
-        for _, row in seasonal.iterrows()
-    ]
+    # Seasonal breakdown
+    season_codes, sums, counts = grouped_sums(
+        enriched_df['season'].cat.codes, enriched_df['P_avg'], enriched_df['Ws_avg']
+    )
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg_power, avg_ws = sums / counts
+    seasonal_data = pd.DataFrame({
+        "season": [SEASONS[code] for code in season_codes],
+        "avg_power_kw": rounded(avg_power, 1),
+        "avg_wind_speed_ms": rounded(avg_ws, 2),
+        "capacity_factor_percent": rounded(avg_power / 2050 * 100, 1)
+    }).to_dict('records')
     
     return {
         "turbine_statistics": turbine_stats,
@@ -395,7 +984,8 @@ async def get_scada_summary():
     }
 
 @app.get("/api/data/scada/timeseries")
-async def get_scada_timeseries(
+@openoa_endpoint("Error in SCADA timeseries")
+def get_scada_timeseries(
     turbine_id: Optional[str] = None,
     resolution: str = "daily",
     start_date: Optional[str] = None,
@@ -403,20 +993,15 @@ async def get_scada_timeseries(
     limit: int = 500
 ):
     """Get SCADA time series data for visualization"""
-    if not OPENOA_AVAILABLE:
-        raise HTTPException(status_code=503, detail="OpenOA not available")
-    
-    scada_df = get_cached_data("scada", load_scada_data).copy()
+    scada_df = cached_scada()
     
     # Filter by turbine
     if turbine_id:
-        scada_df = scada_df[scada_df['Wind_turbine_name'] == turbine_id]
+        scada_df = select_turbine(scada_df, turbine_id)
     
-    # Filter by date range
-    if start_date:
-        scada_df = scada_df[scada_df['Date_time'] >= pd.to_datetime(start_date)]
-    if end_date:
-        scada_df = scada_df[scada_df['Date_time'] <= pd.to_datetime(end_date)]
+    # Filter by date range (SCADA rows are time-sorted, and so is each turbine's subset)
+    if start_date or end_date:
+        scada_df = select_time_range(scada_df, 'Date_time', start_date, end_date)
     
     # Set index for resampling
     scada_df = scada_df.set_index('Date_time')
@@ -448,65 +1033,59 @@ async def get_scada_timeseries(
             'Ot_avg': 'mean'
         })
     
-    resampled = resampled.reset_index()
+    resampled = resampled.tail(limit)
     
     # Format data
-    data = []
-    for _, row in resampled.tail(limit).iterrows():
-        item = {
-            "timestamp": row['Date_time'].isoformat() if pd.notna(row['Date_time']) else None,
-            "power_kw": round(float(row['P_avg']), 1) if pd.notna(row['P_avg']) else None,
-            "wind_speed_ms": round(float(row['Ws_avg']), 2) if pd.notna(row['Ws_avg']) else None,
-            "temperature_c": round(float(row['Ot_avg']), 1) if pd.notna(row['Ot_avg']) else None
-        }
-        if turbine_id and 'Ya_avg' in row:
-            item["nacelle_direction_deg"] = round(float(row['Ya_avg']), 1) if pd.notna(row['Ya_avg']) else None
-            item["wind_direction_deg"] = round(float(row['Wa_avg']), 1) if pd.notna(row['Wa_avg']) else None
-        data.append(item)
+    columns = {
+        "timestamp": resampled.index.strftime('%Y-%m-%dT%H:%M:%S'),
+        "power_kw": rounded(resampled['P_avg'], 1),
+        "wind_speed_ms": rounded(resampled['Ws_avg'], 2),
+        "temperature_c": rounded(resampled['Ot_avg'], 1)
+    }
+    if turbine_id:
+        columns["nacelle_direction_deg"] = rounded(resampled['Ya_avg'], 1)
+        columns["wind_direction_deg"] = rounded(resampled['Wa_avg'], 1)
+    data = json_records(pd.DataFrame(columns))
     
-    return {
+    # Returned as a response object so the (potentially large) record list skips jsonable_encoder
+    return FastJSONResponse({
         "resolution": resolution,
         "turbine_filter": turbine_id,
         "data_points": len(data),
         "data": data
-    }
+    })
 
 @app.get("/api/data/power-curve")
-async def get_power_curve_data(turbine_id: Optional[str] = None, bin_width: float = 0.5):
+@openoa_endpoint("Error in power curve")
+def get_power_curve_data(turbine_id: Optional[str] = None, bin_width: float = 0.5):
     """Get power curve data for visualization"""
-    if not OPENOA_AVAILABLE:
-        raise HTTPException(status_code=503, detail="OpenOA not available")
-    
-    scada_df = get_cached_data("scada", load_scada_data).copy()
+    scada_df = cached_scada_enriched()
     
     if turbine_id:
-        scada_df = scada_df[scada_df['Wind_turbine_name'] == turbine_id]
+        scada_df = select_turbine(scada_df, turbine_id)
     
     # Filter for valid operating data
     scada_df = scada_df[(scada_df['P_avg'] >= 0) & (scada_df['Ws_avg'] >= 0) & (scada_df['Ws_avg'] <= 30)]
     
-    # Bin by wind speed
-    bins = np.arange(0, 30 + bin_width, bin_width)
-    scada_df['ws_bin'] = pd.cut(scada_df['Ws_avg'], bins=bins)
-    
-    binned = scada_df.groupby('ws_bin', observed=True).agg({
-        'P_avg': ['mean', 'std', 'count', lambda x: np.percentile(x, 5), lambda x: np.percentile(x, 95)],
-        'Ws_avg': 'mean'
-    }).reset_index()
-    
-    binned.columns = ['ws_bin', 'power_mean', 'power_std', 'count', 'power_p5', 'power_p95', 'ws_mean']
-    
-    power_curve = []
-    for _, row in binned.iterrows():
-        if row['count'] >= 10:
-            power_curve.append({
-                "wind_speed": round(float(row['ws_mean']), 2),
-                "power_mean": round(float(row['power_mean']), 1),
-                "power_std": round(float(row['power_std']), 1) if pd.notna(row['power_std']) else 0,
-                "power_p5": round(float(row['power_p5']), 1),
-                "power_p95": round(float(row['power_p95']), 1),
-                "count": int(row['count'])
-            })
+    # Bin by wind speed, reusing the precomputed bins for the default width
+    bins = power_curve_bins(bin_width)
+    ws = scada_df['Ws_avg'].to_numpy()
+    if bin_width == POWER_CURVE_BIN_WIDTH:
+        bin_idx = scada_df['ws_bin_idx'].to_numpy()
+    else:
+        bin_idx = power_curve_bin_index(ws, bins)
+    
+    binned = binned_power_stats(bin_idx, ws, scada_df['P_avg'].to_numpy(), len(bins) - 1)
+    binned = binned[binned['count'] >= 10]
+    
+    power_curve = pd.DataFrame({
+        "wind_speed": rounded(binned['ws_mean'], 2),
+        "power_mean": rounded(binned['power_mean'], 1),
+        "power_std": rounded(binned['power_std'].fillna(0), 1),
+        "power_p5": rounded(binned['power_p5'], 1),
+        "power_p95": rounded(binned['power_p95'], 1),
+        "count": binned['count'].to_numpy(dtype=np.int64)
+    }).to_dict('records')
     
     # Manufacturer power curve (approximate for Senvion MM82)
     manufacturer_curve = [
@@ -537,15 +1116,13 @@ async def get_power_curve_data(turbine_id: Optional[str] = None, bin_width: floa
     }
 
 @app.get("/api/data/wind-rose")
-async def get_wind_rose_data(turbine_id: Optional[str] = None):
+@openoa_endpoint("Error in wind rose")
+def get_wind_rose_data(turbine_id: Optional[str] = None):
     """Get wind rose data for visualization"""
-    if not OPENOA_AVAILABLE:
-        raise HTTPException(status_code=503, detail="OpenOA not available")
-    
-    scada_df = get_cached_data("scada", load_scada_data).copy()
+    scada_df = cached_scada()
     
     if turbine_id:
-        scada_df = scada_df[scada_df['Wind_turbine_name'] == turbine_id]
+        scada_df = select_turbine(scada_df, turbine_id)
     
     # Filter valid data
     scada_df = scada_df[(scada_df['Wa_avg'] >= 0) & (scada_df['Wa_avg'] <= 360) & (scada_df['Ws_avg'] >= 0)]
@@ -555,28 +1132,51 @@ async def get_wind_rose_data(turbine_id: Optional[str] = None):
     speed_bins = [0, 4, 8, 12, 16, 25]
     speed_labels = ['0-4 m/s', '4-8 m/s', '8-12 m/s', '12-16 m/s', '16+ m/s']
     
-    scada_df['dir_bin'] = pd.cut(scada_df['Wa_avg'], bins=direction_bins, labels=direction_bins[:-1], include_lowest=True)
-    scada_df['speed_bin'] = pd.cut(scada_df['Ws_avg'], bins=speed_bins, labels=speed_labels)
-    
+    n_dirs, n_speeds = len(direction_bins) - 1, len(speed_labels)
+
+    # Right-closed bin indices (same edges as pd.cut); direction 0° belongs to the first sector
+    wa = scada_df['Wa_avg'].to_numpy(dtype=np.float64)
+    ws = scada_df['Ws_avg'].to_numpy(dtype=np.float64)
+    power = scada_df['P_avg'].to_numpy(dtype=np.float64)
+    dir_idx = np.maximum(uniform_bin_index(wa, 0, 22.5), 0)
+    speed_idx = np.digitize(ws, speed_bins, right=True) - 1
+
+    # One pass per statistic over all sectors instead of a boolean mask per sector
+    counts = np.bincount(dir_idx, minlength=n_dirs)
+    ws_sums = np.bincount(dir_idx, weights=ws, minlength=n_dirs)
+    has_power = ~np.isnan(power)
+    power_sums = np.bincount(dir_idx[has_power], weights=power[has_power], minlength=n_dirs)
+    power_counts = np.bincount(dir_idx[has_power], minlength=n_dirs)
+
+    in_speed_range = (speed_idx >= 0) & (speed_idx < n_speeds)
+    speed_counts = np.bincount(
+        dir_idx[in_speed_range] * n_speeds + speed_idx[in_speed_range], minlength=n_dirs * n_speeds
+    ).reshape(n_dirs, n_speeds)
+    speed_totals = speed_counts.sum(axis=1, keepdims=True)
+    speed_pct = np.divide(speed_counts * 100.0, speed_totals,
+                          out=np.zeros(speed_counts.shape), where=speed_totals > 0)
+
     wind_rose = []
     total_count = len(scada_df)
-    
-    for dir_center in direction_bins[:-1]:
-        dir_data = scada_df[scada_df['dir_bin'] == dir_center]
-        if len(dir_data) > 0:
-            speed_dist = dir_data['speed_bin'].value_counts(normalize=True)
-            wind_rose.append({
-                "direction": int(dir_center),
-                "direction_label": f"{int(dir_center)}°",
-                "frequency_percent": round(float(len(dir_data) / total_count * 100), 2),
-                "avg_speed_ms": round(float(dir_data['Ws_avg'].mean()), 2),
-                "avg_power_kw": round(float(dir_data['P_avg'].mean()), 1),
-                "speed_distribution": {
-                    label: round(float(speed_dist.get(label, 0) * 100), 1) 
-                    for label in speed_labels
-                },
-                "count": int(len(dir_data))
-            })
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg_speed = ws_sums / counts
+        avg_power = power_sums / power_counts
+
+    for i in np.flatnonzero(counts):
+        dir_center = direction_bins[i]
+        wind_rose.append({
+            "direction": int(dir_center),
+            "direction_label": f"{int(dir_center)}°",
+            "frequency_percent": round(float(counts[i] / total_count * 100), 2),
+            "avg_speed_ms": round(float(avg_speed[i]), 2),
+            "avg_power_kw": round(float(avg_power[i]), 1),
+            "speed_distribution": {
+                label: round(float(pct), 1)
+                for label, pct in zip(speed_labels, speed_pct[i])
+            },
+            "count": int(counts[i])
+        })
     
     # Predominant wind direction
     predominant = max(wind_rose, key=lambda x: x['frequency_percent']) if wind_rose else None
@@ -590,40 +1190,33 @@ async def get_wind_rose_data(turbine_id: Optional[str] = None):
         "speed_bins": speed_labels
     }
 
-@app.get("/api/data/reanalysis")
-async def get_reanalysis_data():
-    """Get reanalysis data comparison and long-term trends"""
-    if not OPENOA_AVAILABLE:
-        raise HTTPException(status_code=503, detail="OpenOA not available")
-    
-    era5_df = get_cached_data("era5", load_era5_data).copy()
-    merra2_df = get_cached_data("merra2", load_merra2_data).copy()
+def reanalysis_payload():
+    """Response body of /api/data/reanalysis, built from the static example data"""
+    era5_df = cached_era5()
+    merra2_df = cached_merra2()
     
     # Annual statistics for ERA5
-    era5_df['year'] = era5_df['datetime'].dt.year
-    era5_annual = era5_df.groupby('year').agg({
-        'ws_100m': 'mean',
-        'dens_100m': 'mean'
-    }).reset_index()
+    era5_years, sums, counts = grouped_sums(
+        datetime_field(era5_df['datetime'], 'year'), era5_df['ws_100m'], era5_df['dens_100m']
+    )
+    with np.errstate(invalid='ignore', divide='ignore'):
+        era5_annual_ws, era5_annual_dens = sums / counts
     
     # Annual statistics for MERRA2
-    merra2_df['year'] = merra2_df['datetime'].dt.year
-    merra2_annual = merra2_df.groupby('year').agg({
-        'ws_50m': 'mean',
-        'dens_50m': 'mean'
-    }).reset_index()
+    merra2_years, sums, counts = grouped_sums(
+        datetime_field(merra2_df['datetime'], 'year'), merra2_df['ws_50m'], merra2_df['dens_50m']
+    )
+    with np.errstate(invalid='ignore', divide='ignore'):
+        merra2_annual_ws, merra2_annual_dens = sums / counts
     
     # Long-term average
     era5_ltm = float(era5_df['ws_100m'].mean())
     merra2_ltm = float(merra2_df['ws_50m'].mean())
     
     # Monthly climatology for ERA5
-    era5_df['month'] = era5_df['datetime'].dt.month
-    era5_monthly = era5_df.groupby('month').agg({
-        'ws_100m': 'mean'
-    }).reset_index()
-    
-    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    era5_months, sums, counts = grouped_sums(datetime_field(era5_df['datetime'], 'month'), era5_df['ws_100m'])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        era5_monthly_ws = sums[0] / counts[0]
     
     return {
         "era5": {
@@ -631,37 +1224,28 @@ async def get_reanalysis_data():
             "total_years": int(era5_df['datetime'].max().year - era5_df['datetime'].min().year + 1),
             "data_points": int(len(era5_df)),
             "long_term_mean_ws_ms": round(era5_ltm, 2),
-            "annual_data": [
-                {
-                    "year": int(row['year']),
-                    "avg_wind_speed_ms": round(float(row['ws_100m']), 2),
-                    "avg_density_kgm3": round(float(row['dens_100m']), 3),
-                    "anomaly_percent": round(float((row['ws_100m'] - era5_ltm) / era5_ltm * 100), 1)
-                }
-                for _, row in era5_annual.iterrows()
-            ],
-            "monthly_climatology": [
-                {
-                    "month": month_names[int(row['month']) - 1],
-                    "avg_wind_speed_ms": round(float(row['ws_100m']), 2)
-                }
-                for _, row in era5_monthly.iterrows()
-            ]
+            "annual_data": pd.DataFrame({
+                "year": era5_years.astype(np.int64),
+                "avg_wind_speed_ms": rounded(era5_annual_ws, 2),
+                "avg_density_kgm3": rounded(era5_annual_dens, 3),
+                "anomaly_percent": rounded((era5_annual_ws - era5_ltm) / era5_ltm * 100, 1)
+            }).to_dict('records'),
+            "monthly_climatology": pd.DataFrame({
+                "month": [MONTH_NAMES[m - 1] for m in era5_months],
+                "avg_wind_speed_ms": rounded(era5_monthly_ws, 2)
+            }).to_dict('records')
         },
         "merra2": {
             "period": f"{merra2_df['datetime'].min().year}-{merra2_df['datetime'].max().year}",
             "total_years": int(merra2_df['datetime'].max().year - merra2_df['datetime'].min().year + 1),
             "data_points": int(len(merra2_df)),
             "long_term_mean_ws_ms": round(merra2_ltm, 2),
-            "annual_data": [
-                {
-                    "year": int(row['year']),
-                    "avg_wind_speed_ms": round(float(row['ws_50m']), 2),
-                    "avg_density_kgm3": round(float(row['dens_50m']), 3),
-                    "anomaly_percent": round(float((row['ws_50m'] - merra2_ltm) / merra2_ltm * 100), 1)
-                }
-                for _, row in merra2_annual.iterrows()
-            ]
+            "annual_data": pd.DataFrame({
+                "year": merra2_years.astype(np.int64),
+                "avg_wind_speed_ms": rounded(merra2_annual_ws, 2),
+                "avg_density_kgm3": rounded(merra2_annual_dens, 3),
+                "anomaly_percent": rounded((merra2_annual_ws - merra2_ltm) / merra2_ltm * 100, 1)
+            }).to_dict('records')
         },
         "comparison": {
             "correlation_note": "ERA5 at 100m hub height, MERRA2 at 50m - direct comparison requires height adjustment",
@@ -670,39 +1254,37 @@ async def get_reanalysis_data():
         }
     }
 
-@app.get("/api/data/availability")
-async def get_availability_data():
-    """Get detailed availability and curtailment data"""
-    if not OPENOA_AVAILABLE:
-        raise HTTPException(status_code=503, detail="OpenOA not available")
-    
-    plant_df = get_cached_data("plant", load_plant_data).copy()
+@app.get("/api/data/reanalysis")
+@openoa_endpoint("Error in reanalysis data")
+def get_reanalysis_data(request: Request):
+    """Get reanalysis data comparison and long-term trends"""
+    return cached_json_response(request, "response:reanalysis", reanalysis_payload)
+
+def availability_payload():
+    """Response body of /api/data/availability, built from the static example data"""
+    plant_df = cached_plant()
+    energy_columns = ['net_energy_kwh', 'availability_kwh', 'curtailment_kwh']
     
     # Monthly breakdown
-    plant_df['month'] = plant_df['time_utc'].dt.to_period('M')
-    monthly = plant_df.groupby('month').agg({
-        'net_energy_kwh': 'sum',
-        'availability_kwh': 'sum',
-        'curtailment_kwh': 'sum'
-    }).reset_index()
-    monthly['month'] = monthly['month'].astype(str)
+    month_key = year_month_key(plant_df['time_utc'])
+    monthly = plant_df[energy_columns].groupby(month_key).sum().drop(index=-1, errors='ignore')
+    monthly['month'] = year_month_labels(monthly.index)
     
     # Calculate potential energy and availability percentage
-    monthly_data = []
-    for _, row in monthly.iterrows():
-        potential = row['net_energy_kwh'] + row['availability_kwh'] + row['curtailment_kwh']
-        availability_pct = (1 - row['availability_kwh'] / potential) * 100 if potential > 0 else 100
-        monthly_data.append({
-            "month": row['month'],
-            "net_energy_mwh": round(float(row['net_energy_kwh'] / 1000), 1),
-            "availability_loss_mwh": round(float(row['availability_kwh'] / 1000), 2),
-            "curtailment_mwh": round(float(row['curtailment_kwh'] / 1000), 2),
-            "availability_percent": round(float(availability_pct), 1)
-        })
-    
-    total_net = plant_df['net_energy_kwh'].sum()
-    total_avail_loss = plant_df['availability_kwh'].sum()
-    total_curtail = plant_df['curtailment_kwh'].sum()
+    net, avail_loss, curtail = monthly[energy_columns].to_numpy(dtype=np.float64).T
+    potential = net + avail_loss + curtail
+    with np.errstate(invalid='ignore', divide='ignore'):
+        availability_pct = np.where(potential > 0, (1 - avail_loss / potential) * 100, 100.0)
+    monthly_data = pd.DataFrame({
+        "month": monthly['month'],
+        "net_energy_mwh": rounded(net / 1000, 1),
+        "availability_loss_mwh": rounded(avail_loss / 1000, 2),
+        "curtailment_mwh": rounded(curtail / 1000, 2),
+        "availability_percent": rounded(availability_pct, 1)
+    }).to_dict('records')
+    
+    # Plant totals in one reduction over the three energy columns
+    total_net, total_avail_loss, total_curtail = np.nansum(plant_df[energy_columns].to_numpy(dtype=np.float64), axis=0)
     total_potential = total_net + total_avail_loss + total_curtail
     
     return {
@@ -717,178 +1299,295 @@ async def get_availability_data():
         }
     }
 
+@app.get("/api/data/availability")
+@openoa_endpoint("Error in availability data")
+def get_availability_data(request: Request):
+    """Get detailed availability and curtailment data"""
+    return cached_json_response(request, "response:availability", availability_payload)
+
+# Serialized bodies of the constant endpoints above, built during startup warmup
+RESPONSE_LOADERS = (
+    ("response:info", serialized_response(api_info_payload)),
+    ("response:overview", serialized_response(data_overview_payload)),
+    ("response:reanalysis", serialized_response(reanalysis_payload)),
+    ("response:availability", serialized_response(availability_payload)),
+)
+
 # =============================================================================
 # ANALYSIS ENDPOINTS
 # =============================================================================
 
+# Catalogue served by /api/analyses: immutable, and serialized once at import since it never changes
+ANALYSES_CATALOGUE = (
+    MappingProxyType({
+        "id": "aep",
+        "name": "Monte Carlo AEP",
+        "full_name": "Monte Carlo Annual Energy Production Analysis",
+        "status": "available",
+        "description": "Estimate long-term AEP with Monte Carlo uncertainty quantification",
+        "outputs": ("Annual energy (GWh)", "Uncertainty bounds", "Monthly breakdown", "Capacity factor"),
+        "category": "Energy Assessment"
+    }),
+    MappingProxyType({
+        "id": "electrical_losses",
+        "name": "Electrical Losses",
+        "full_name": "Electrical Losses Analysis",
+        "status": "available",
+        "description": "Compare turbine SCADA output to revenue meter to quantify electrical losses",
+        "outputs": ("Loss percentage", "Energy lost (GWh)", "Monthly trends", "Confidence intervals"),
+        "category": "Loss Analysis"
+    }),
+    MappingProxyType({
+        "id": "wake_losses",
+        "name": "Wake Losses",
+        "full_name": "Internal Wake Losses Analysis",
+        "status": "available",
+        "description": "Estimate wake-induced energy losses using freestream turbine comparison",
+        "outputs": ("Wake loss percentage", "Direction-dependent losses", "Turbine-level impacts"),
+        "category": "Loss Analysis"
+    }),
+    MappingProxyType({
+        "id": "turbine_gross_energy",
+        "name": "Turbine Gross Energy",
+        "full_name": "Turbine Long-Term Gross Energy Analysis",
+        "status": "available",
+        "description": "Calculate long-term gross energy per turbine using GAM models",
+        "outputs": ("Per-turbine gross energy", "Long-term correction factors", "Uncertainty estimates"),
+        "category": "Energy Assessment"
+    }),
+    MappingProxyType({
+        "id": "yaw_misalignment",
+        "name": "Yaw Misalignment",
+        "full_name": "Static Yaw Misalignment Detection",
+        "status": "available",
+        "description": "Detect systematic yaw errors using power-vane analysis",
+        "outputs": ("Per-turbine misalignment", "Wind speed dependencies", "Correction recommendations"),
+        "category": "Performance Analysis"
+    }),
+    MappingProxyType({
+        "id": "eya_gap",
+        "name": "EYA Gap Analysis",
+        "full_name": "Energy Yield Assessment Gap Analysis",
+        "status": "available",
+        "description": "Compare pre-construction predictions with operational results",
+        "outputs": ("Waterfall chart data", "Category-wise gaps", "Root cause indicators"),
+        "category": "Assessment Comparison"
+    }),
+)
+ANALYSES_BODY, ANALYSES_ETAG = serialized_response(lambda: {"analyses": ANALYSES_CATALOGUE})()
+
 @app.get("/api/analyses")
-async def list_analyses():
+async def list_analyses(request: Request):
     """List all available analyses with detailed descriptions"""
-    return {
-        "analyses": [
-            {
-                "id": "aep",
-                "name": "Monte Carlo AEP",
-                "full_name": "Monte Carlo Annual Energy Production Analysis",
-                "status": "available",
-                "description": "Estimate long-term AEP with Monte Carlo uncertainty quantification",
-                "outputs": ["Annual energy (GWh)", "Uncertainty bounds", "Monthly breakdown", "Capacity factor"],
-                "category": "Energy Assessment"
-            },
-            {
-                "id": "electrical_losses",
-                "name": "Electrical Losses",
-                "full_name": "Electrical Losses Analysis",
-                "status": "available",
-                "description": "Compare turbine SCADA output to revenue meter to quantify electrical losses",
-                "outputs": ["Loss percentage", "Energy lost (GWh)", "Monthly trends", "Confidence intervals"],
-                "category": "Loss Analysis"
-            },
-            {
-                "id": "wake_losses",
-                "name": "Wake Losses",
-                "full_name": "Internal Wake Losses Analysis",
-                "status": "available",
-                "description": "Estimate wake-induced energy losses using freestream turbine comparison",
-                "outputs": ["Wake loss percentage", "Direction-dependent losses", "Turbine-level impacts"],
-                "category": "Loss Analysis"
-            },
-            {
-                "id": "turbine_gross_energy",
-                "name": "Turbine Gross Energy",
-                "full_name": "Turbine Long-Term Gross Energy Analysis",
-                "status": "available",
-                "description": "Calculate long-term gross energy per turbine using GAM models",
-                "outputs": ["Per-turbine gross energy", "Long-term correction factors", "Uncertainty estimates"],
-                "category": "Energy Assessment"
-            },
-            {
-                "id": "yaw_misalignment",
-                "name": "Yaw Misalignment",
-                "full_name": "Static Yaw Misalignment Detection",
-                "status": "available",
-                "description": "Detect systematic yaw errors using power-vane analysis",
-                "outputs": ["Per-turbine misalignment", "Wind speed dependencies", "Correction recommendations"],
-                "category": "Performance Analysis"
-            },
-            {
-                "id": "eya_gap",
-                "name": "EYA Gap Analysis",
-                "full_name": "Energy Yield Assessment Gap Analysis",
-                "status": "available",
-                "description": "Compare pre-construction predictions with operational results",
-                "outputs": ["Waterfall chart data", "Category-wise gaps", "Root cause indicators"],
-                "category": "Assessment Comparison"
-            }
-        ]
-    }
+    return etag_json_response(request, ANALYSES_BODY, ANALYSES_ETAG)
 
-@app.post("/api/run-analysis", response_model=AnalysisResponse)
-async def run_analysis(request: AnalysisRequest):
-    """Run a specific OpenOA analysis"""
-    if not OPENOA_AVAILABLE:
-        raise HTTPException(status_code=503, detail="OpenOA library not available")
-    
-    start_time = datetime.now()
-    
+# Recent analysis results, reused while fresh because the input datasets never change at runtime,
+# and the runs in progress, which concurrent requests for the same key join instead of repeating.
+# Only touched from the event loop thread, so no lock is needed.
+ANALYSIS_CACHE_TTL_SECONDS = 300
+ANALYSIS_CACHE_MAXSIZE = 64
+_analysis_results = OrderedDict()
+_analysis_runs = {}
+
+def analysis_cache_key(analysis_type: str, params: Dict[str, Any]):
+    """Cache key for an analysis run: its implementation (so aliases share entries) plus the
+    canonical JSON of its parameters"""
+    return ANALYSIS_DISPATCH[analysis_type].__name__, json.dumps(params, sort_keys=True, default=str)
+
+def get_cached_analysis(key):
+    """Results stored under ``key`` if they have not expired, else None"""
+    entry = _analysis_results.get(key)
+    if entry is None:
+        return None
+    expires_at, results = entry
+    if expires_at < time.monotonic():
+        del _analysis_results[key]
+        return None
+    _analysis_results.move_to_end(key)
+    return results
+
+def store_analysis(key, results):
+    """Remember analysis results for ANALYSIS_CACHE_TTL_SECONDS, evicting the least recently used"""
+    _analysis_results[key] = (time.monotonic() + ANALYSIS_CACHE_TTL_SECONDS, results)
+    _analysis_results.move_to_end(key)
+    while len(_analysis_results) > ANALYSIS_CACHE_MAXSIZE:
+        _analysis_results.popitem(last=False)
+
+async def execute_analysis(key, analysis_type: str, params: Dict[str, Any]):
+    """Run an analysis in the worker pool and cache its results under ``key``"""
+    loop = asyncio.get_running_loop()
+    executor = get_analysis_executor()
     try:
-        analysis_type = request.analysis_type
-        params = request.parameters or {}
-        
-        # Route to appropriate analysis
-        if analysis_type in ["monte_carlo_aep", "aep"]:
-            results = await run_aep_analysis(params)
-        elif analysis_type == "electrical_losses":
-            results = await run_electrical_losses_analysis(params)
-        elif analysis_type == "wake_losses":
-            results = await run_wake_losses_analysis(params)
-        elif analysis_type == "turbine_gross_energy":
-            results = await run_turbine_gross_energy_analysis(params)
-        elif analysis_type == "yaw_misalignment":
-            results = await run_yaw_misalignment_analysis(params)
-        elif analysis_type == "eya_gap":
-            results = await run_eya_gap_analysis(params)
-        else:
-            raise HTTPException(status_code=400, detail=f"Unknown analysis type: {analysis_type}")
-        
-        execution_time = (datetime.now() - start_time).total_seconds()
-        
-        return AnalysisResponse(
-            status="success",
-            analysis_type=analysis_type,
-            results=results,
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            message="Analysis completed successfully using real OpenOA data",
-            execution_time_seconds=round(execution_time, 2)
-        )
-        
-    except Exception as e:
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+        results = await loop.run_in_executor(executor, _sync_dispatch, analysis_type, params)
+    except BrokenProcessPool:
+        # A worker died (e.g. killed for memory); start a fresh pool for later requests
+        shutdown_analysis_executor(executor)
+        raise
+    store_analysis(key, results)
+    return results
+
+async def shared_analysis_run(key, analysis_type: str, params: Dict[str, Any]):
+    """Results of a fresh run for ``key``, joining the run already in progress if there is one
+
+    The run is shielded, so a client disconnecting does not cancel it for the other waiters.
+    """
+    run = _analysis_runs.get(key)
+    if run is None:
+        run = asyncio.ensure_future(execute_analysis(key, analysis_type, params))
+        _analysis_runs[key] = run
+        run.add_done_callback(lambda _: _analysis_runs.pop(key, None))
+    return await asyncio.shield(run)
+
+def inline_json_schema(model):
+    """JSON schema of a model with nested model ``$ref``s inlined, for use in ``openapi_extra``
+    (FastAPI copies that verbatim, so refs into the model's own ``$defs`` would dangle)"""
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def resolve(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return resolve(defs[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+
+    return resolve(schema)
+
+async def analysis_request_body(request: Request) -> AnalysisRequest:
+    """Validate the run-analysis body straight from its JSON bytes in pydantic-core
+
+    FastAPI would first json.loads the body into Python objects and then validate those.
+    """
+    try:
+        return AnalysisRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)
+        ])
+
+@app.post(
+    "/api/run-analysis",
+    response_class=FastJSONResponse,
+    responses={200: {"model": AnalysisResponse}},
+    openapi_extra={"requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": inline_json_schema(AnalysisRequest)}}
+    }}
+)
+@openoa_endpoint("Analysis failed")
+async def run_analysis(request: AnalysisRequest = Depends(analysis_request_body), nocache: bool = False):
+    """Run a specific OpenOA analysis (``nocache=true`` forces a fresh run)"""
+    start_ns = time.perf_counter_ns()
+    
+    analysis_type = request.analysis_type
+    params = request.parameters.model_dump(exclude_none=True) if request.parameters else {}
+    
+    # Route to appropriate analysis
+    if analysis_type not in ANALYSIS_DISPATCH:
+        raise HTTPException(status_code=400, detail=f"Unknown analysis type: {analysis_type}")
+    cache_key = analysis_cache_key(analysis_type, params)
+    results = None if nocache else get_cached_analysis(cache_key)
+    if results is None:
+        results = await shared_analysis_run(cache_key, analysis_type, params)
+    
+    execution_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+    
+    # Returned as a response object built from a plain dict: the analysis results go straight to
+    # orjson, without validating them into an AnalysisResponse (the documented 200 schema) and
+    # walking them again with jsonable_encoder
+    return FastJSONResponse({
+        "status": "success",
+        "analysis_type": analysis_type,
+        "results": results,
+        "timestamp": utc_timestamp(),
+        "message": "Analysis completed successfully using real OpenOA data",
+        "execution_time_ms": execution_time_ms
+    })
 
 # =============================================================================
 # ANALYSIS IMPLEMENTATIONS
 # =============================================================================
 
-async def run_aep_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
+# Invariant parts of the analysis results, built once and shared by every run (plain dicts and
+# tuples, since results are pickled back from the analysis workers; never mutated)
+WAKE_LOSSES_METHODOLOGY = {
+    "description": "Freestream turbine comparison method",
+    "freestream_identification": "Direction-dependent normalized power analysis",
+    "uncertainty_source": "Bootstrap resampling (simulated)"
+}
+
+GROSS_ENERGY_METHODOLOGY = {
+    "model": "Generalized Additive Model (GAM)",
+    "predictors": ("Wind speed", "Air density", "Wind direction"),
+    "long_term_source": "ERA5 100m wind speed"
+}
+
+YAW_MISALIGNMENT_METHODOLOGY = {
+    "approach": "Power performance binned by wind vane angle",
+    "wind_speed_range_ms": "5-10 m/s (Region 2 operation)",
+    "fitting_method": "Mean power per vane bin with normalization",
+    "threshold_for_action_deg": 3.0
+}
+
+# Typical EYA predictions for comparison (based on industry benchmarks)
+EYA_PREDICTIONS = {
+    "gross_energy_gwh": 22.0,
+    "wake_loss_percent": 8.0,
+    "availability_loss_percent": 3.0,
+    "electrical_loss_percent": 2.0,
+    "turbine_performance_percent": 2.0,
+    "environmental_loss_percent": 1.0,
+    "curtailment_percent": 0.5,
+    "net_aep_gwh": 18.5
+}
+
+def run_aep_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
     """Run Monte Carlo AEP Analysis using real OpenOA data"""
     
-    scada_df = get_cached_data("scada", load_scada_data)
-    era5_df = get_cached_data("era5", load_era5_data)
+    scada_df = cached_scada()
+    scada_stats = cached_scada_stats()
+    era5_stats = cached_era5_stats()
     
     # Calculate real energy production statistics
-    total_energy_kwh = float(scada_df['P_avg'].sum())
+    total_energy_kwh = scada_stats['power_sum_kw']
     total_energy_gwh = total_energy_kwh / 1e6
     
     # Time period
-    date_range = scada_df['Date_time'].max() - scada_df['Date_time'].min()
-    years = date_range.days / 365.25
+    years = scada_stats['years']
     annual_energy_gwh = total_energy_gwh / years if years > 0 else total_energy_gwh
     
     # Long-term correction using reanalysis
     # Compare operational period wind to long-term average
-    op_start = scada_df['Date_time'].min()
-    op_end = scada_df['Date_time'].max()
-    
-    era5_op_period = era5_df[(era5_df['datetime'] >= op_start) & (era5_df['datetime'] <= op_end)]
-    op_period_ws = float(era5_op_period['ws_100m'].mean()) if len(era5_op_period) > 0 else float(era5_df['ws_100m'].mean())
-    ltm_ws = float(era5_df['ws_100m'].mean())
-    
-    # Wind-energy relationship approximation (cubic relationship adjusted)
-    ltm_correction_factor = (ltm_ws / op_period_ws) ** 2.5 if op_period_ws > 0 else 1.0
+    op_period_ws = era5_stats['op_period_ws']
+    ltm_ws = era5_stats['ltm_ws']
+    ltm_correction_factor = era5_stats['ltm_correction']
     ltm_annual_energy_gwh = annual_energy_gwh * ltm_correction_factor
     
-    # Monthly breakdown (normalized to annual)
-    scada_copy = scada_df.copy()
-    scada_copy['month'] = scada_copy['Date_time'].dt.month
-    monthly_data = []
-    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    
-    for month in range(1, 13):
-        month_df = scada_copy[scada_copy['month'] == month]
-        if not month_df.empty:
-            month_energy_gwh = float(month_df['P_avg'].sum()) / 1e6 / years
-            month_ws = float(month_df['Ws_avg'].mean())
-            month_cf = float(month_df['P_avg'].mean()) / 2050 * 100
-            monthly_data.append({
-                "month": month_names[month-1],
-                "energy_gwh": round(month_energy_gwh * ltm_correction_factor, 3),
-                "avg_wind_speed_ms": round(month_ws, 2),
-                "capacity_factor_percent": round(month_cf, 1)
-            })
-    
-    # Turbine breakdown
-    turbine_data = []
-    for turbine in sorted(scada_df['Wind_turbine_name'].unique()):
-        t_df = scada_df[scada_df['Wind_turbine_name'] == turbine]
-        t_annual = float(t_df['P_avg'].sum()) / 1e6 / years * ltm_correction_factor
-        t_cf = float(t_df['P_avg'].mean()) / 2050 * 100
-        turbine_data.append({
-            "turbine_id": turbine,
-            "annual_energy_gwh": round(t_annual, 3),
-            "capacity_factor_percent": round(t_cf, 1),
-            "contribution_percent": round(t_annual / ltm_annual_energy_gwh * 100, 1)
-        })
+    # Monthly breakdown (normalized to annual), from the per-calendar-month sums
+    months, sums, counts = scada_stats['calendar_month_power_ws']
+    with np.errstate(invalid='ignore', divide='ignore'):
+        month_power_mean, month_ws_mean = sums / counts
+    monthly_data = pd.DataFrame({
+        "month": [MONTH_NAMES[m - 1] for m in months],
+        "energy_gwh": rounded(sums[0] / 1e6 / years * ltm_correction_factor, 3),
+        "avg_wind_speed_ms": rounded(month_ws_mean, 2),
+        "capacity_factor_percent": rounded(month_power_mean / 2050 * 100, 1)
+    }).to_dict('records')
+    
+    # Turbine breakdown, from the per-turbine-code sums (categories are sorted by name)
+    turbine_names = scada_df['Wind_turbine_name'].cat.categories
+    turbine_codes, turbine_sums, turbine_counts = scada_stats['turbine_power']
+    turbine_annual_gwh = turbine_sums[0] / 1e6 / years * ltm_correction_factor
+    with np.errstate(invalid='ignore', divide='ignore'):
+        turbine_power_mean = turbine_sums[0] / turbine_counts[0]
+    turbine_data = pd.DataFrame({
+        "turbine_id": turbine_names[turbine_codes],
+        "annual_energy_gwh": rounded(turbine_annual_gwh, 3),
+        "capacity_factor_percent": rounded(turbine_power_mean / 2050 * 100, 1),
+        "contribution_percent": rounded(turbine_annual_gwh / ltm_annual_energy_gwh * 100, 1)
+    }).to_dict('records')
     
     # Uncertainty estimation (typical for this method)
     uncertainty_percent = 4.5
@@ -910,38 +1609,39 @@ async def run_aep_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
             "uncertainty_gwh": round(uncertainty_gwh, 3),
             "uncertainty_percent": uncertainty_percent
         },
-        "capacity_factor_percent": round(float(scada_df['P_avg'].mean()) / 2050 * 100, 1),
+        "capacity_factor_percent": round(scada_stats['power_mean_kw'] / 2050 * 100, 1),
         "long_term_correction": {
             "operational_wind_speed_ms": round(op_period_ws, 2),
             "long_term_wind_speed_ms": round(ltm_ws, 2),
             "correction_factor": round(ltm_correction_factor, 3),
-            "reanalysis_years": int(era5_df['datetime'].max().year - era5_df['datetime'].min().year + 1)
+            "reanalysis_years": era5_stats['last_year'] - era5_stats['first_year'] + 1
         },
         "analysis_period": {
-            "start": scada_df['Date_time'].min().isoformat(),
-            "end": scada_df['Date_time'].max().isoformat(),
+            "start": scada_stats['start'].isoformat(),
+            "end": scada_stats['end'].isoformat(),
             "years": round(years, 2)
         },
         "monthly_production": monthly_data,
         "turbine_breakdown": turbine_data,
         "data_quality": {
-            "total_data_points": int(len(scada_df)),
-            "data_availability_percent": round(len(scada_df) / (4 * 365.25 * 24 * 6 * years) * 100, 1)
+            "total_data_points": scada_stats['records'],
+            "data_availability_percent": round(scada_stats['records'] / (4 * 365.25 * 24 * 6 * years) * 100, 1)
         }
     }
 
-async def run_electrical_losses_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
+def run_electrical_losses_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
     """Run Electrical Losses Analysis using real OpenOA data"""
     
-    scada_df = get_cached_data("scada", load_scada_data)
-    plant_df = get_cached_data("plant", load_plant_data)
+    # Totals and monthly sums come from the SCADA and meter reductions computed once per data load
+    scada_stats = cached_scada_stats()
+    plant_stats = cached_plant_stats()
     
     # Calculate turbine-level energy (sum of all turbines, convert 10-min to hourly)
     # P_avg is power in kW, data is 10-min intervals, so energy = P * (10/60) kWh per record
-    turbine_energy_kwh = float(scada_df['P_avg'].sum()) * (10/60)
+    turbine_energy_kwh = scada_stats['turbine_energy_kwh']
     
     # Calculate meter-level energy
-    meter_energy_kwh = float(plant_df['net_energy_kwh'].sum())
+    meter_energy_kwh = plant_stats['net_energy_kwh']
     
     # Calculate electrical losses
     if turbine_energy_kwh > 0:
@@ -951,28 +1651,21 @@ async def run_electrical_losses_analysis(params: Dict[str, Any]) -> Dict[str, An
         electrical_loss_kwh = 0
         electrical_loss_percent = 0
     
-    # Monthly breakdown
-    scada_copy = scada_df.copy()
-    plant_copy = plant_df.copy()
-    scada_copy['month'] = scada_copy['Date_time'].dt.to_period('M')
-    plant_copy['month'] = plant_copy['time_utc'].dt.to_period('M')
-    
-    scada_monthly = scada_copy.groupby('month')['P_avg'].sum() * (10/60)
-    meter_monthly = plant_copy.groupby('month')['net_energy_kwh'].sum()
-    
-    monthly_losses = []
-    for month in scada_monthly.index:
-        if month in meter_monthly.index:
-            t_energy = float(scada_monthly[month])
-            m_energy = float(meter_monthly[month])
-            loss = (t_energy - m_energy) / t_energy * 100 if t_energy > 0 else 0
-            monthly_losses.append({
-                "month": str(month),
-                "turbine_energy_mwh": round(t_energy / 1000, 1),
-                "meter_energy_mwh": round(m_energy / 1000, 1),
-                "loss_mwh": round((t_energy - m_energy) / 1000, 2),
-                "loss_percent": round(loss, 2)
-            })
+    # Monthly breakdown for the months both sources cover, aligned on their shared year_month_key
+    month_keys, month_power, _ = scada_stats['month_power']
+    meter_keys, meter_energy, _ = plant_stats['month_net_energy']
+    months, scada_idx, meter_idx = np.intersect1d(month_keys, meter_keys, assume_unique=True, return_indices=True)
+    t_energy = month_power[0][scada_idx] * (10/60)
+    m_energy = meter_energy[0][meter_idx]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        loss = np.where(t_energy > 0, (t_energy - m_energy) / t_energy * 100, 0)
+    monthly_losses = pd.DataFrame({
+        "month": year_month_labels(months),
+        "turbine_energy_mwh": rounded(t_energy / 1000, 1),
+        "meter_energy_mwh": rounded(m_energy / 1000, 1),
+        "loss_mwh": rounded((t_energy - m_energy) / 1000, 2),
+        "loss_percent": rounded(loss, 2)
+    }).to_dict('records')
     
     # Uncertainty estimation
     uncertainty_percent = 0.5
@@ -1001,60 +1694,75 @@ async def run_electrical_losses_analysis(params: Dict[str, Any]) -> Dict[str, An
             "other_losses_percent": round(electrical_loss_percent * 0.1, 2)
         },
         "data_quality": {
-            "scada_records": int(len(scada_df)),
-            "meter_records": int(len(plant_df)),
+            "scada_records": scada_stats['records'],
+            "meter_records": plant_stats['records'],
             "analysis_period_months": len(monthly_losses)
         }
     }
 
-async def run_wake_losses_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
+def run_wake_losses_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
     """Run Wake Losses Analysis using real OpenOA data"""
     
-    scada_df = get_cached_data("scada", load_scada_data)
-    asset_df = get_cached_data("asset", load_asset_data)
+    scada_df = cached_scada()
+    scada_stats = cached_scada_stats()
     
     # Get turbine positions
-    turbine_positions = asset_df.to_dict('records')
+    turbine_positions = cached_asset_records()
     
-    # Calculate per-turbine performance by wind direction
-    scada_copy = scada_df.copy()
+    # Calculate per-turbine performance by wind direction: right-closed 30° sectors (0° falls in the
+    # first), accumulated per (sector, turbine) cell in one bincount pass instead of a mask per sector
     direction_bins = np.arange(0, 361, 30)
-    scada_copy['dir_bin'] = pd.cut(scada_copy['Wa_avg'], bins=direction_bins, labels=direction_bins[:-1], include_lowest=True)
-    
-    # For each direction, find variation in turbine performance
-    direction_losses = []
-    for dir_center in direction_bins[:-1]:
-        dir_df = scada_copy[scada_copy['dir_bin'] == dir_center]
-        if len(dir_df) < 100:
-            continue
-        
-        # Group by turbine and calculate normalized power
-        turbine_perf = dir_df.groupby('Wind_turbine_name').agg({
-            'P_avg': 'mean',
-            'Ws_avg': 'mean'
-        })
-        
+    n_dirs = len(direction_bins) - 1
+    turbines = scada_df['Wind_turbine_name'].cat.categories
+    n_turbines = len(turbines)
+    wa = scada_df['Wa_avg'].to_numpy(dtype=np.float64)
+    in_sector = (wa >= 0) & (wa <= 360)
+    dir_idx = np.maximum(uniform_bin_index(wa[in_sector], 0, 30), 0)
+    turbine_idx = scada_df['Wind_turbine_name'].cat.codes.to_numpy()[in_sector]
+    ws = scada_df['Ws_avg'].to_numpy(dtype=np.float64)[in_sector]
+    power = scada_df['P_avg'].to_numpy(dtype=np.float64)[in_sector]
+    
+    dir_counts = np.bincount(dir_idx, minlength=n_dirs)
+    has_ws = ~np.isnan(ws)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        dir_ws_mean = (np.bincount(dir_idx[has_ws], weights=ws[has_ws], minlength=n_dirs)
+                       / np.bincount(dir_idx[has_ws], minlength=n_dirs))
+    
+    def cell_means(values):
+        """NaN-skipping mean of ``values`` per (sector, turbine) cell"""
+        keep = (turbine_idx >= 0) & ~np.isnan(values)
+        cells = dir_idx[keep] * n_turbines + turbine_idx[keep]
+        sums = np.bincount(cells, weights=values[keep], minlength=n_dirs * n_turbines)
+        counts = np.bincount(cells, minlength=n_dirs * n_turbines)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return (sums / counts).reshape(n_dirs, n_turbines)
+    
+    has_turbine = turbine_idx >= 0
+    cell_rows = np.bincount(
+        dir_idx[has_turbine] * n_turbines + turbine_idx[has_turbine], minlength=n_dirs * n_turbines
+    ).reshape(n_dirs, n_turbines)
+    cell_power, cell_ws = cell_means(power), cell_means(ws)
+    
+    # For each direction with enough samples and more than one turbine, find variation in turbine
+    # performance, for all such sectors at once (cells without records are NaN)
+    compared = np.flatnonzero((dir_counts >= 100) & ((cell_rows > 0).sum(axis=1) > 1))
+    with np.errstate(invalid='ignore', divide='ignore'):
         # Normalize power by wind speed^3 for fair comparison
-        turbine_perf['normalized_power'] = turbine_perf['P_avg'] / (turbine_perf['Ws_avg'] ** 3 + 0.1)
-        
-        if len(turbine_perf) > 1:
-            max_norm = turbine_perf['normalized_power'].max()
-            avg_norm = turbine_perf['normalized_power'].mean()
-            wake_loss = (max_norm - avg_norm) / max_norm * 100 if max_norm > 0 else 0
-            
-            # Find best and worst performing turbines
-            best_turbine = turbine_perf['normalized_power'].idxmax()
-            worst_turbine = turbine_perf['normalized_power'].idxmin()
-            
-            direction_losses.append({
-                "direction_center_deg": int(dir_center),
-                "direction_range": f"{int(dir_center)}-{int(dir_center + 30)}°",
-                "wake_loss_percent": round(float(wake_loss), 2),
-                "sample_count": int(len(dir_df)),
-                "avg_wind_speed_ms": round(float(dir_df['Ws_avg'].mean()), 2),
-                "best_turbine": best_turbine,
-                "worst_turbine": worst_turbine
-            })
+        normalized_power = np.where(cell_rows > 0, cell_power / (cell_ws ** 3 + 0.1), np.nan)[compared]
+        max_norm = np.nanmax(normalized_power, axis=1)
+        avg_norm = np.nanmean(normalized_power, axis=1)
+        wake_loss = np.where(max_norm > 0, (max_norm - avg_norm) / max_norm * 100, 0)
+    dir_centers = direction_bins[compared].astype(np.int64)
+    direction_losses = pd.DataFrame({
+        "direction_center_deg": dir_centers,
+        "direction_range": [f"{center}-{center + 30}°" for center in dir_centers],
+        "wake_loss_percent": rounded(wake_loss, 2),
+        "sample_count": dir_counts[compared],
+        "avg_wind_speed_ms": rounded(dir_ws_mean[compared], 2),
+        # Best and worst performing turbines
+        "best_turbine": turbines[np.nanargmax(normalized_power, axis=1)],
+        "worst_turbine": turbines[np.nanargmin(normalized_power, axis=1)]
+    }).to_dict('records')
     
     # Overall wake loss (weighted by sample count)
     if direction_losses:
@@ -1063,20 +1771,19 @@ async def run_wake_losses_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
     else:
         weighted_loss = 0
     
-    # Per-turbine wake impact
-    turbine_wake_impact = []
-    for turbine in sorted(scada_df['Wind_turbine_name'].unique()):
-        t_df = scada_df[scada_df['Wind_turbine_name'] == turbine]
-        all_avg = scada_df.groupby('Wind_turbine_name')['P_avg'].mean().mean()
-        t_avg = float(t_df['P_avg'].mean())
-        relative_perf = (t_avg - all_avg) / all_avg * 100 if all_avg > 0 else 0
-        
-        turbine_wake_impact.append({
-            "turbine_id": turbine,
-            "avg_power_kw": round(t_avg, 1),
-            "relative_performance_percent": round(relative_perf, 1),
-            "wake_exposure": "High" if relative_perf < -2 else "Medium" if relative_perf < 0 else "Low (freestream)"
-        })
+    # Per-turbine wake impact, relative to the fleet average computed once for all turbines
+    turbine_mean_power = scada_df.groupby('Wind_turbine_name', observed=True)['P_avg'].mean()
+    all_avg = turbine_mean_power.mean()
+    t_avg = turbine_mean_power.to_numpy(dtype=np.float64)
+    relative_perf = (t_avg - all_avg) / all_avg * 100 if all_avg > 0 else np.zeros_like(t_avg)
+    turbine_wake_impact = pd.DataFrame({
+        "turbine_id": turbine_mean_power.index.astype(str),
+        "avg_power_kw": rounded(t_avg, 1),
+        "relative_performance_percent": rounded(relative_perf, 1),
+        "wake_exposure": np.select(
+            [relative_perf < -2, relative_perf < 0], ["High", "Medium"], "Low (freestream)"
+        ).astype(object)
+    }).to_dict('records')
     
     return {
         "analysis_method": "OpenOA Wake Losses Analysis (Freestream Comparison)",
@@ -1088,70 +1795,69 @@ async def run_wake_losses_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
                 "lower_percent": round(weighted_loss - 2.0, 2),
                 "upper_percent": round(weighted_loss + 2.0, 2)
             },
-            "annual_energy_loss_gwh": round(weighted_loss / 100 * get_cached_data("scada", load_scada_data)['P_avg'].sum() / 1e6 / 2, 3)
+            "annual_energy_loss_gwh": round(weighted_loss / 100 * scada_stats['power_sum_kw'] / 1e6 / 2, 3)
         },
         "direction_dependent_losses": direction_losses,
         "turbine_wake_impact": turbine_wake_impact,
         "turbine_layout": turbine_positions,
-        "methodology": {
-            "description": "Freestream turbine comparison method",
-            "freestream_identification": "Direction-dependent normalized power analysis",
-            "uncertainty_source": "Bootstrap resampling (simulated)"
-        }
+        "methodology": WAKE_LOSSES_METHODOLOGY
     }
 
-async def run_turbine_gross_energy_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
+def run_turbine_gross_energy_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
     """Run Turbine Long-Term Gross Energy Analysis"""
     
-    scada_df = get_cached_data("scada", load_scada_data)
-    era5_df = get_cached_data("era5", load_era5_data)
+    scada_df = cached_scada()
+    era5_stats = cached_era5_stats()
     
-    date_range = scada_df['Date_time'].max() - scada_df['Date_time'].min()
-    years = date_range.days / 365.25
+    years = cached_scada_stats()['years']
     
     # ERA5 long-term stats
-    era5_ltm_ws = float(era5_df['ws_100m'].mean())
-    op_start = scada_df['Date_time'].min()
-    op_end = scada_df['Date_time'].max()
-    era5_op = era5_df[(era5_df['datetime'] >= op_start) & (era5_df['datetime'] <= op_end)]
-    era5_op_ws = float(era5_op['ws_100m'].mean()) if len(era5_op) > 0 else era5_ltm_ws
-    
-    ltm_correction = (era5_ltm_ws / era5_op_ws) ** 2.5 if era5_op_ws > 0 else 1.0
-    
-    # Per-turbine analysis
-    turbine_results = []
-    total_gross = 0
-    
-    for turbine in sorted(scada_df['Wind_turbine_name'].unique()):
-        t_df = scada_df[scada_df['Wind_turbine_name'] == turbine]
-        
-        # Filter for normal operation
-        normal_df = t_df[(t_df['P_avg'] > 10) & (t_df['Ws_avg'] >= 3) & (t_df['Ws_avg'] <= 25)]
-        
-        # Calculate gross energy (energy during operation, no losses)
-        operational_energy_kwh = float(normal_df['P_avg'].sum()) * (10/60)
-        availability = len(normal_df) / len(t_df) if len(t_df) > 0 else 1.0
-        
-        # Gross = Net / (1 - losses)
-        estimated_losses = 0.06  # ~6% typical losses
-        gross_energy_kwh = operational_energy_kwh / (1 - estimated_losses)
-        
-        # Annualize and apply long-term correction
-        annual_gross_gwh = (gross_energy_kwh / 1e6 / years) * ltm_correction
-        total_gross += annual_gross_gwh
-        
-        # Capacity factor based on gross
-        gross_cf = annual_gross_gwh * 1000 / (2.05 * 8760) * 100  # 2.05 MW rated
-        
-        turbine_results.append({
-            "turbine_id": turbine,
-            "gross_energy_gwh_annual": round(annual_gross_gwh, 3),
-            "gross_capacity_factor_percent": round(gross_cf, 1),
-            "data_availability_percent": round(availability * 100, 1),
-            "operational_hours": int(len(normal_df) / 6),  # 10-min intervals to hours
-            "avg_operating_power_kw": round(float(normal_df['P_avg'].mean()), 1),
-            "uncertainty_percent": 3.0
-        })
+    era5_ltm_ws = era5_stats['ltm_ws']
+    era5_op_ws = era5_stats['op_period_ws']
+    
+    ltm_correction = era5_stats['ltm_correction']
+    
+    # Per-turbine analysis: record counts, plus power totals over normal operation, accumulated
+    # per turbine code in one pass (categories are sorted by name)
+    turbine_names = scada_df['Wind_turbine_name'].cat.categories
+    codes = scada_df['Wind_turbine_name'].cat.codes.to_numpy()
+    power = scada_df['P_avg'].to_numpy(dtype=np.float64)
+    ws = scada_df['Ws_avg'].to_numpy(dtype=np.float64)
+    has_turbine = codes >= 0
+    normal = has_turbine & (power > 10) & (ws >= 3) & (ws <= 25)
+    turbine_rows = np.bincount(codes[has_turbine], minlength=len(turbine_names))
+    normal_rows = np.bincount(codes[normal], minlength=len(turbine_names))
+    normal_power_sum = np.bincount(codes[normal], weights=power[normal], minlength=len(turbine_names))
+    
+    # Per-turbine figures as arrays over the turbines with records, rounded column by column
+    present = np.flatnonzero(turbine_rows)
+    turbine_rows, normal_rows, normal_power_sum = turbine_rows[present], normal_rows[present], normal_power_sum[present]
+    
+    # Calculate gross energy (energy during operation, no losses)
+    operational_energy_kwh = normal_power_sum * (10/60)
+    
+    # Gross = Net / (1 - losses)
+    estimated_losses = 0.06  # ~6% typical losses
+    gross_energy_kwh = operational_energy_kwh / (1 - estimated_losses)
+    
+    # Annualize and apply long-term correction
+    annual_gross_gwh = (gross_energy_kwh / 1e6 / years) * ltm_correction
+    total_gross = sum(annual_gross_gwh.tolist())
+    
+    # Capacity factor based on gross
+    gross_cf = annual_gross_gwh * 1000 / (2.05 * 8760) * 100  # 2.05 MW rated
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg_operating_power_kw = normal_power_sum / normal_rows
+    turbine_results = pd.DataFrame({
+        "turbine_id": turbine_names[present],
+        "gross_energy_gwh_annual": rounded(annual_gross_gwh, 3),
+        "gross_capacity_factor_percent": rounded(gross_cf, 1),
+        "data_availability_percent": rounded(normal_rows / turbine_rows * 100, 1),
+        "operational_hours": (normal_rows / 6).astype(np.int64),  # 10-min intervals to hours
+        "avg_operating_power_kw": rounded(avg_operating_power_kw, 1),
+        "uncertainty_percent": 3.0
+    }).to_dict('records')
     
     return {
         "analysis_method": "OpenOA Turbine Long-Term Gross Energy (GAM Framework)",
@@ -1166,64 +1872,60 @@ async def run_turbine_gross_energy_analysis(params: Dict[str, Any]) -> Dict[str,
             "long_term_mean_wind_ms": round(era5_ltm_ws, 2),
             "correction_factor": round(ltm_correction, 3),
             "reanalysis_product": "ERA5",
-            "reanalysis_period": f"{era5_df['datetime'].min().year}-{era5_df['datetime'].max().year}"
+            "reanalysis_period": f"{era5_stats['first_year']}-{era5_stats['last_year']}"
         },
         "turbine_results": turbine_results,
-        "methodology": {
-            "model": "Generalized Additive Model (GAM)",
-            "predictors": ["Wind speed", "Air density", "Wind direction"],
-            "long_term_source": "ERA5 100m wind speed"
-        }
+        "methodology": GROSS_ENERGY_METHODOLOGY
     }
 
-async def run_yaw_misalignment_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
+def run_yaw_misalignment_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
     """Run Static Yaw Misalignment Analysis"""
     
-    scada_df = get_cached_data("scada", load_scada_data)
+    scada_df = cached_scada()
+    
+    # Filter for normal operation in optimal wind speed range
+    turbine_names = scada_df['Wind_turbine_name'].cat.categories
+    n_turbines = len(turbine_names)
+    codes = scada_df['Wind_turbine_name'].cat.codes.to_numpy()
+    power = scada_df['P_avg'].to_numpy(dtype=np.float64)
+    ws = scada_df['Ws_avg'].to_numpy(dtype=np.float64)
+    vane = scada_df['Va_avg'].to_numpy(dtype=np.float64)
+    normal = (codes >= 0) & (power > 100) & (ws >= 5) & (ws <= 10)
+    turbine_samples = np.bincount(codes[normal], minlength=n_turbines)
+    
+    # Analyze vane position vs power: right-closed 2° vane bins, with power, vane angle and wind
+    # speed accumulated per (turbine, bin) cell in one bincount pass instead of a groupby per turbine
+    vane_bins = np.arange(-30, 31, 2)
+    n_bins = len(vane_bins) - 1
+    binned = normal & (vane > vane_bins[0]) & (vane <= vane_bins[-1])
+    cells = codes[binned] * n_bins + uniform_bin_index(vane[binned], vane_bins[0], 2)
+    cell_count = np.bincount(cells, minlength=n_turbines * n_bins).reshape(n_turbines, n_bins)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        power_mean, vane_mean, ws_mean = (
+            np.bincount(cells, weights=values[binned], minlength=n_turbines * n_bins).reshape(n_turbines, n_bins) / cell_count
+            for values in (power, vane, ws)
+        )
     
     turbine_results = []
     
-    for turbine in sorted(scada_df['Wind_turbine_name'].unique()):
-        t_df = scada_df[scada_df['Wind_turbine_name'] == turbine].copy()
-        
-        # Filter for normal operation in optimal wind speed range
-        t_df = t_df[(t_df['P_avg'] > 100) & (t_df['Ws_avg'] >= 5) & (t_df['Ws_avg'] <= 10)]
-        
-        if len(t_df) < 1000:
-            continue
-        
-        # Analyze vane position vs power
-        # Bin by vane angle
-        vane_bins = np.arange(-30, 31, 2)
-        t_df['vane_bin'] = pd.cut(t_df['Va_avg'], bins=vane_bins)
-        
-        vane_power = t_df.groupby('vane_bin', observed=True).agg({
-            'P_avg': ['mean', 'count'],
-            'Va_avg': 'mean',
-            'Ws_avg': 'mean'
-        })
-        vane_power.columns = ['power_mean', 'count', 'vane_mean', 'ws_mean']
-        vane_power = vane_power[vane_power['count'] >= 50].reset_index()
+    for code in np.flatnonzero(turbine_samples >= 1000):
+        bins = np.flatnonzero(cell_count[code] >= 50)
         
         # Find optimal vane position (maximum power)
-        if len(vane_power) > 3:
+        if len(bins) > 3:
             # Normalize power by wind speed
-            vane_power['norm_power'] = vane_power['power_mean'] / (vane_power['ws_mean'] ** 3 + 0.1)
-            optimal_idx = vane_power['norm_power'].idxmax()
-            optimal_vane = float(vane_power.loc[optimal_idx, 'vane_mean'])
+            norm_power = power_mean[code, bins] / (ws_mean[code, bins] ** 3 + 0.1)
+            optimal_vane = float(vane_mean[code, bins[np.argmax(norm_power)]])
             
             # Misalignment is the offset from 0
             misalignment = -optimal_vane  # Negative because vane shows relative direction
             
             # Power-vane curve for visualization
-            vane_curve = [
-                {
-                    "vane_angle_deg": round(float(row['vane_mean']), 1),
-                    "avg_power_kw": round(float(row['power_mean']), 1),
-                    "sample_count": int(row['count'])
-                }
-                for _, row in vane_power.iterrows()
-            ]
+            vane_curve = pd.DataFrame({
+                "vane_angle_deg": rounded(vane_mean[code, bins], 1),
+                "avg_power_kw": rounded(power_mean[code, bins], 1),
+                "sample_count": cell_count[code, bins]
+            }).to_dict('records')
             
             # Estimate energy loss from misalignment
             # Approximately cos^3 relationship
@@ -1235,12 +1937,12 @@ async def run_yaw_misalignment_analysis(params: Dict[str, Any]) -> Dict[str, Any
                 recommendation = f"Adjust yaw offset {abs(misalignment):.1f}° {direction}"
             
             turbine_results.append({
-                "turbine_id": turbine,
+                "turbine_id": turbine_names[code],
                 "yaw_misalignment_deg": round(misalignment, 1),
                 "uncertainty_deg": 1.5,
                 "optimal_vane_position_deg": round(optimal_vane, 1),
                 "estimated_energy_loss_percent": round(energy_loss_percent, 2),
-                "sample_count": int(len(t_df)),
+                "sample_count": int(turbine_samples[code]),
                 "recommendation": recommendation,
                 "vane_power_curve": vane_curve
             })
@@ -1259,31 +1961,25 @@ async def run_yaw_misalignment_analysis(params: Dict[str, Any]) -> Dict[str, Any
             "turbines_needing_correction": len([t for t in turbine_results if abs(t['yaw_misalignment_deg']) >= 3])
         },
         "turbine_results": turbine_results,
-        "methodology": {
-            "approach": "Power performance binned by wind vane angle",
-            "wind_speed_range_ms": "5-10 m/s (Region 2 operation)",
-            "fitting_method": "Mean power per vane bin with normalization",
-            "threshold_for_action_deg": 3.0
-        }
+        "methodology": YAW_MISALIGNMENT_METHODOLOGY
     }
 
-async def run_eya_gap_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
+def run_eya_gap_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
     """Run EYA Gap Analysis - comparing predictions to operational results"""
     
-    scada_df = get_cached_data("scada", load_scada_data)
-    plant_df = get_cached_data("plant", load_plant_data)
+    scada_stats = cached_scada_stats()
+    plant_stats = cached_plant_stats()
     
-    date_range = scada_df['Date_time'].max() - scada_df['Date_time'].min()
-    years = date_range.days / 365.25
+    years = scada_stats['years']
     
     # Calculate operational results
-    turbine_energy = float(scada_df['P_avg'].sum()) * (10/60) / 1e6 / years  # GWh/year
-    meter_energy = float(plant_df['net_energy_kwh'].sum()) / 1e6 / years  # GWh/year
+    turbine_energy = scada_stats['turbine_energy_kwh'] / 1e6 / years  # GWh/year
+    meter_energy = plant_stats['net_energy_kwh'] / 1e6 / years  # GWh/year
     
     # Availability and curtailment from plant data
-    total_potential = float(plant_df['net_energy_kwh'].sum() + plant_df['availability_kwh'].sum() + plant_df['curtailment_kwh'].sum()) / 1e6 / years
-    avail_loss = float(plant_df['availability_kwh'].sum()) / 1e6 / years
-    curtail_loss = float(plant_df['curtailment_kwh'].sum()) / 1e6 / years
+    total_potential = (plant_stats['net_energy_kwh'] + plant_stats['availability_kwh'] + plant_stats['curtailment_kwh']) / 1e6 / years
+    avail_loss = plant_stats['availability_kwh'] / 1e6 / years
+    curtail_loss = plant_stats['curtailment_kwh'] / 1e6 / years
     
     # Electrical losses from prior analysis
     elec_loss = (turbine_energy - meter_energy) if turbine_energy > meter_energy else 0
@@ -1293,17 +1989,7 @@ async def run_eya_gap_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
     gross_energy = total_potential / (1 - wake_loss_percent/100 - avail_loss/total_potential - curtail_loss/total_potential - elec_loss/total_potential)
     wake_loss = gross_energy * wake_loss_percent / 100
     
-    # Typical EYA predictions for comparison (based on industry benchmarks)
-    eya_predictions = {
-        "gross_energy_gwh": 22.0,
-        "wake_loss_percent": 8.0,
-        "availability_loss_percent": 3.0,
-        "electrical_loss_percent": 2.0,
-        "turbine_performance_percent": 2.0,
-        "environmental_loss_percent": 1.0,
-        "curtailment_percent": 0.5,
-        "net_aep_gwh": 18.5
-    }
+    eya_predictions = EYA_PREDICTIONS
     
     # Operational actuals
     operational_results = {
@@ -1360,6 +2046,21 @@ async def run_eya_gap_analysis(params: Dict[str, Any]) -> Dict[str, Any]:
         ]
     }
 
+# Analysis type accepted by /api/run-analysis -> implementation ("aep" is an alias)
+ANALYSIS_DISPATCH = {
+    "monte_carlo_aep": run_aep_analysis,
+    "aep": run_aep_analysis,
+    "electrical_losses": run_electrical_losses_analysis,
+    "wake_losses": run_wake_losses_analysis,
+    "turbine_gross_energy": run_turbine_gross_energy_analysis,
+    "yaw_misalignment": run_yaw_misalignment_analysis,
+    "eya_gap": run_eya_gap_analysis,
+}
+
+def _sync_dispatch(analysis_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one analysis to completion; the entry point executed in the analysis worker processes"""
+    return ANALYSIS_DISPATCH[analysis_type](params)
+
 # =============================================================================
 # MAIN
 # =============================================================================
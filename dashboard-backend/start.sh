@@ -8,4 +8,4 @@ export PYTHONPATH="${PYTHONPATH}:$(pwd)"
 cd dashboard-backend
 
 # Start the server
-exec uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000}
+exec uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000} --loop uvloop --http httptools
@@ -56,9 +56,11 @@ interface AnalysisResult {
   results: any;
   timestamp: string;
   message: string;
-  execution_time_seconds?: number;
+  execution_time_ms?: number;
 }
 
+const formatExecutionTime = (ms?: number) => `${((ms ?? 0) / 1000).toFixed(2)}s`;
+
 export default function Dashboard() {
   // State
   const [activeTab, setActiveTab] = useState('overview');
@@ -885,7 +887,7 @@ export default function Dashboard() {
                           <CheckCircle className="w-4 h-4 sm:w-5 sm:h-5 text-green-400 flex-shrink-0" />
                           <div>
                             <h4 className="font-medium text-white capitalize text-sm sm:text-base">{key.replace(/_/g, ' ')}</h4>
-                            <p className="text-xs sm:text-sm text-slate-400">Completed in {result.execution_time_seconds}s</p>
+                            <p className="text-xs sm:text-sm text-slate-400">Completed in {formatExecutionTime(result.execution_time_ms)}</p>
                           </div>
                         </div>
                         <button className="px-3 py-1.5 bg-slate-600 text-slate-300 rounded text-xs sm:text-sm hover:bg-slate-500 transition flex items-center gap-1 w-fit">
@@ -1109,7 +1111,7 @@ function AnalysisResultCard({ analysisId, result }: { analysisId: string; result
         <div className="flex items-center gap-2 sm:gap-3 min-w-0 flex-1">
           <CheckCircle className="w-4 h-4 sm:w-5 sm:h-5 text-green-400 flex-shrink-0" />
           <h3 className="font-semibold text-white capitalize text-sm sm:text-base truncate">{analysisId.replace(/_/g, ' ')} Results</h3>
-          <span className="text-[10px] sm:text-xs text-slate-400 flex-shrink-0">• {result.execution_time_seconds}s</span>
+          <span className="text-[10px] sm:text-xs text-slate-400 flex-shrink-0">• {formatExecutionTime(result.execution_time_ms)}</span>
         </div>
         <ChevronRight className={`w-4 h-4 sm:w-5 sm:h-5 text-slate-400 transition-transform flex-shrink-0 ${expanded ? 'rotate-90' : ''}`} />
       </div>